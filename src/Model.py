@@ -131,11 +131,23 @@ class Model(ModelData):
         latency = self.evaluationsLatency.get(metric_name, 0.0)
         return int(latency * 1000)
 
-    def evaluate_all(self, metrics: List[Metric]) -> None:
+    def evaluate_all(
+        self,
+        metrics: List[Metric],
+        fetch_latency: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Run every metric concurrently and record its score and latency.
+        `fetch_latency` maps metric names to time already spent fetching
+        their metadata, which is added to the measured latency.
+        """
+        fetch_latency = fetch_latency or {}
+
         def evaluate_metric(metric: Metric):
             start = time.time()
             score = metric.evaluate(self)
             latency = time.time() - start
+            latency += fetch_latency.get(type(metric).__name__, 0.0)
             return (metric, score, latency)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -29,6 +29,14 @@ Environment
 - `GITHUB_TOKEN` (required): Used to authenticate GitHub API requests.
 - `LOG_LEVEL` (optional): Set to 1 (INFO) or 2 (DEBUG) to enable logging.
 - `LOG_FILE` (optional): Path to a file where logs should be written.
+- `MODEL_HUB_CACHE_DIR` (optional): Directory for on-disk caches
+  (default: ~/.cache/model-hub-cli).
+- `LLM_TIMEOUT` (optional): Minimum read timeout in seconds for LLM API
+  calls (default: 15).
+- `LLM_NOCACHE` (optional): Set to bypass the on-disk LLM response and
+  score caches.
+- `METADATA_NOCACHE` (optional): Set to bypass the on-disk cache of
+  GitHub and Hugging Face API responses.
 
 Exit Codes
 ----------
@@ -47,7 +55,8 @@ Notes
 -----
 - URL validation and metadata fetching are handled by utilities and metric classes.
 - Logging is optional and silent by default unless explicitly enabled.
-- This module avoids direct network calls aside from GitHub token validation.
+- This module avoids direct network calls aside from GitHub token validation
+  and prewarming connections to the metadata hosts.
 """
 
 import os
@@ -58,6 +67,7 @@ from loguru import logger
 
 from src.Model import Model
 from src.ModelCatalogue import ModelCatalogue
+from src.util.metadata_fetchers import prewarm_connections
 
 
 def validate_github_token() -> bool:
@@ -189,4 +199,6 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: run <absolute_path_to_input_file>")
         sys.exit(1)
+    # Handshake with the API hosts while the token and input are checked
+    prewarm_connections()
     sys.exit(run_catalogue(sys.argv[1]))
@@ -40,6 +40,9 @@ import requests
 from src.ModelData import ModelData
 from src.Metric import Metric
 
+# Used to reject digit-free LLM replies without running the score regex
+_DIGITS = frozenset("0123456789")
+
 
 class DatasetQualityMetric(Metric):
     """
@@ -166,6 +169,10 @@ No explanation needed.
     def _parse_score(self, content: str) -> Optional[float]:
         """Extract numerical score from LLM response."""
         try:
+            # No digits means no score; skip the regex scan entirely
+            if _DIGITS.isdisjoint(content):
+                return None
+
             # Look for decimal numbers
             matches: List[str] = re.findall(r'\b\d*\.?\d+\b', content)
 
@@ -73,6 +73,11 @@ class PerformanceClaimsMetric(Metric):
         if metadata.get("readme"):
             readme = metadata.get("readme", "")
 
+        # Non-HF links and empty model pages have nothing to analyze
+        if not card_data and not readme:
+            logger.warning("No model card or README available; skipping LLM query.")
+            return 0.0
+
         # Compose a prompt for the LLM using extracted metadata
         prompt = (
             "Given the following Hugging Face model metadata and documentation:\n\n"
@@ -93,5 +98,6 @@ class PerformanceClaimsMetric(Metric):
         response = self.llm_client.send_prompt(prompt)
         score = self.llm_client.extract_score(response)
 
+        # extract_score already clamps to [0.0, 1.0]
         logger.info("PerformanceClaimsMetric: LLM-based score -> {}", score)
-        return min(score, 1.0)
+        return score
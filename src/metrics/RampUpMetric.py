@@ -1,16 +1,55 @@
+import hashlib
+import os
 import re
-from typing import Dict, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from src.Metric import Metric
 from src.ModelData import ModelData
+from src.util.DiskCache import DiskCache
 from src.util.LLMClient import LLMClient
 
+# LLM scores keyed by prompt hash; a week is short enough to pick up README edits
+_SCORE_CACHE = DiskCache("rampup_llm", ttl=7 * 24 * 60 * 60)
+
+# README sections worth sending to the LLM, keyed by the heading keywords
+_SECTIONS_TO_EXTRACT: Dict[str, Tuple[str, ...]] = {
+    "Installation": ("installation", "setup", "getting started"),
+    "Usage": ("usage", "how to use", "examples"),
+    "Dataset": ("dataset", "data", "inputs"),
+    "Training": ("training", "train", "fine-tune", "finetune"),
+}
+
+# Match H2/H3 markdown headings and their content
+_HEADING_RX = re.compile(r"(#{2,3})\s+(.*)", re.IGNORECASE)
+
+# All section keywords fused into one pattern with a named group per section.
+# The lookahead reports a match at every offset (keywords may overlap), and the
+# alternation order makes earlier sections win, as in _SECTIONS_TO_EXTRACT.
+_SECTION_KEYWORD_RX = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{name}>" + "|".join(map(re.escape, keywords)) + ")"
+        for name, keywords in _SECTIONS_TO_EXTRACT.items()
+    ) + ")"
+)
+_SECTION_ORDER: Dict[str, int] = {
+    name: i for i, name in enumerate(_SECTIONS_TO_EXTRACT)
+}
+
+# Input budget for README text. llama3.1 averages about 4 characters per
+# token on English prose, which is close enough to size the prompt without
+# shipping a tokenizer.
+_MAX_README_TOKENS = 1024
+_CHARS_PER_TOKEN = 4
+
 
 class RampUpMetric(Metric):
-    def __init__(self) -> None:
-        self.llm: LLMClient = LLMClient()
+    @cached_property
+    def llm(self) -> LLMClient:
+        # Built on first use so models without a README never construct a client
+        return LLMClient()
 
     def evaluate(self, model: ModelData) -> float:
         logger.debug("Evaluating Ramp Up Time Metric...")
@@ -46,56 +85,109 @@ class RampUpMetric(Metric):
             "You may include justifications *after* the score if needed, but "
             "only the first line will be used as the final metric.\n"
         )
-        full_prompt: str = readme_text + "\n\n" + prompt
-
-        # Query the LLM and extract the score
-        response: str = self.llm.send_prompt(full_prompt)
+        full_prompt: str = "\n\n".join(part for part in (readme_text, prompt) if part)
+
+        # Reuse the score from a previous run with an equivalent prompt,
+        # unless LLM caching is switched off
+        use_cache = not os.getenv("LLM_NOCACHE")
+        cache_key: str = self._cache_key(full_prompt)
+        cached_score = _SCORE_CACHE.get(cache_key) if use_cache else None
+        if cached_score is not None:
+            logger.debug("Ramp Up Time Metric score served from cache")
+            return float(cached_score)
+
+        # Query the LLM and extract the score. The client's response cache is
+        # skipped since the score cache above already covers this prompt.
+        response: str = self.llm.send_prompt(full_prompt, cache=False)
         score: float = self.llm.extract_score(response)
 
+        # Failed or unparseable replies are not cached so they are retried
+        # next run
+        if use_cache and self.llm.parse_score(response) is not None:
+            _SCORE_CACHE.set(cache_key, score)
+
         logger.debug(f"Ramp Up Time Metric score: {score}")
         return score
 
-    def _extract_relevant_sections(self, readme: str, max_chars: int = 8000) -> str:
+    def _cache_key(self, prompt: str) -> str:
         """
-        Extract key sections from a long README to prepare a concise,
-        high-signal LLM prompt.
+        Hash the prompt after folding case and whitespace, so templated model
+        cards that differ only in formatting share a cached score.
         """
-        if not readme:
-            return ""
-
-        sections_to_extract = {
-            "Installation": ["installation", "setup", "getting started"],
-            "Usage": ["usage", "how to use", "examples"],
-            "Dataset": ["dataset", "data", "inputs"],
-            "Training": ["training", "train", "fine-tune", "finetune"]
+        normalized = " ".join(prompt.lower().split())
+        return hashlib.sha256(
+            f"{LLMClient.DEFAULT_MODEL}|{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def _classify_heading(self, heading: str) -> Optional[str]:
+        """
+        Return the first section in _SECTIONS_TO_EXTRACT with a keyword in the
+        (lowercased) heading, scanning the heading once.
+        """
+        sections = {
+            m.lastgroup for m in _SECTION_KEYWORD_RX.finditer(heading) if m.lastgroup
         }
+        if not sections:
+            return None
+        return min(sections, key=_SECTION_ORDER.__getitem__)
 
-        # Match H2/H3 markdown headings and their content
-        pattern = re.compile(r"(#{2,3})\s+(.*)", re.IGNORECASE)
-        matches = list(pattern.finditer(readme))
+    def _extract_relevant_sections(
+        self, readme: str, max_tokens: int = _MAX_README_TOKENS
+    ) -> str:
+        """
+        Extract key sections from a long README to prepare a concise,
+        high-signal LLM prompt within a token budget. READMEs that already
+        fit are returned as-is.
+        """
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        if len(readme) <= max_chars:
+            return readme
 
-        # Extract sections based on headings
+        # Scan headings lazily; a section's content ends at the next heading.
+        # Stop once every section is found.
         extracted_sections: Dict[str, str] = {}
-        for i, match in enumerate(matches):
-            heading = match.group(2).strip().lower()
-            content_start = match.end()
-            content_end = (
-                matches[i + 1].start() if i + 1 < len(matches) else len(readme)
-            )
-            content = readme[content_start:content_end].strip()
+        pending: Optional[Tuple[str, int]] = None
+        for match in _HEADING_RX.finditer(readme):
+            if pending:
+                name, content_start = pending
+                content = readme[content_start:match.start()].strip()
+                extracted_sections[name] = f"## {name}\n{content}"
+                pending = None
+                if len(extracted_sections) == len(_SECTIONS_TO_EXTRACT):
+                    break
 
             # Check if this heading matches any target sections
-            for section_name, keywords in sections_to_extract.items():
-                if any(keyword in heading for keyword in keywords):
-                    if section_name not in extracted_sections:
-                        extracted_sections[section_name] = (
-                            f"## {section_name}\n{content}"
-                        )
-                    break
+            section_name = self._classify_heading(match.group(2).strip().lower())
+            if section_name and section_name not in extracted_sections:
+                pending = (section_name, match.end())
+        else:
+            if pending:
+                name, content_start = pending
+                extracted_sections[name] = (
+                    f"## {name}\n{readme[content_start:].strip()}"
+                )
 
         # Fallback: return first max_chars characters if no section found
         if not extracted_sections:
             return readme[:max_chars] + "\n..."
 
-        combined = "\n\n".join(extracted_sections.values())
-        return combined[:max_chars] + ("\n..." if len(combined) > max_chars else "")
+        sections = list(extracted_sections.values())
+        return "\n\n".join(self._fit_sections(sections, max_chars))
+
+    def _fit_sections(self, sections: List[str], max_chars: int) -> List[str]:
+        """
+        Truncate sections to share `max_chars` fairly: short sections are kept
+        whole and their unused share goes to the longer ones, so one long
+        section cannot crowd the others' headings out of the prompt.
+        """
+        remaining = max_chars - 2 * (len(sections) - 1)  # "\n\n" separators
+        fitted = list(sections)
+        by_length = sorted(range(len(sections)), key=lambda i: len(sections[i]))
+        for count, i in enumerate(by_length):
+            share = max(remaining // (len(sections) - count), 0)
+            if len(sections[i]) > share:
+                # Clamp the whole piece; with a share under 4 characters the
+                # "\n..." marker alone would overrun it
+                fitted[i] = (sections[i][:max(share - 4, 0)] + "\n...")[:share]
+            remaining -= len(fitted[i])
+        return fitted
@@ -21,9 +21,12 @@ Key Methods
 -----------
 - `evaluate(model: ModelData) -> dict[str, float]`: Main entry point.
 - `_get_model_size(model)`: Calculates model size in GB.
+- `_get_safetensors_bytes(metadata)`: Exact size from per-dtype parameter
+  counts.
 - `_extract_bytes_from_dtype(metadata)`: Parses dtype to get bytes per param.
 - `_get_parameter_count(metadata)`: Tries multiple fields to infer param count.
-- `_extract_params_from_name(name)`: Fallback using model name patterns.
+- `_extract_params_from_name(name)`: Fallback using model name patterns
+  (M/B/T suffixes).
 
 Notes
 -----
@@ -34,10 +37,49 @@ Notes
 """
 
 
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
 from src.ModelData import ModelData
 from src.Metric import Metric
+from src.util.scoring import clamp01
 from loguru import logger
-from typing import Optional
+from typing import Final, Mapping, Optional, Tuple
+
+# Bit width embedded in a dtype name, e.g. "float16" -> 16, "I8" -> 8
+_DTYPE_BITS_RX = re.compile(r"(\d+)")
+
+# Parameter count in a model name: "125M", "3.5b", "70B", "1.6T". "K" is left
+# out on purpose, since names like "phi-3-mini-4k" use it for context length.
+_PARAM_RX = re.compile(r"(\d+(?:\.\d+)?)\s*([mMbBtT])(?![A-Za-z])")
+_PARAM_SCALE = {"m": 1_000_000, "b": 1_000_000_000, "t": 1_000_000_000_000}
+
+
+# Well-known dtype names (lowercased, without a "torch." prefix), including
+# ones with no bit width in the name
+_DTYPE_BYTES: Final[Mapping[str, float]] = MappingProxyType({
+    "float64": 8, "double": 8, "f64": 8,
+    "float32": 4, "float": 4, "fp32": 4, "f32": 4,
+    "float16": 2, "half": 2, "fp16": 2, "f16": 2,
+    "bfloat16": 2, "bf16": 2,
+    "int8": 1, "uint8": 1, "i8": 1, "u8": 1, "bool": 1,
+    "int4": 0.5, "nf4": 0.5, "fp4": 0.5,
+})
+
+
+@lru_cache(maxsize=256)
+def _dtype_bytes(dtype: str) -> Optional[float]:
+    """Bytes per parameter for a dtype name, or None if it is unrecognized."""
+    name = dtype.lower().rsplit(".", 1)[-1]
+    if name in _DTYPE_BYTES:
+        return _DTYPE_BYTES[name]
+
+    # Fall back to the bit width embedded in the name
+    match = _DTYPE_BITS_RX.search(name)
+    if match is None:
+        return None
+    return int(match.group(1)) / 8
 
 
 class SizeMetric(Metric):
@@ -62,23 +104,39 @@ class SizeMetric(Metric):
       computational inefficiency
 
     Model Size Calculation:
-    - Model Size = Number of Parameters * Average Bytes per Parameter, if available
+    - Model Size = sum(parameter count * dtype bytes) over safetensors.parameters,
+      if available
+    - else, Number of Parameters * Average Bytes per Parameter, if available
     - else, Model Size = usedStorage (if available) in bytes / (1024^3) to convert to GB
     - Uses Hugging Face API to get parameter count and tensor types.
-    - Assumes the first tensor type applies to all parameters.
+    - Without a safetensors breakdown, assumes one dtype for all parameters.
     - Defaults to float16 (2 bytes) if tensor type is unavailable.
     """
 
     # Device specifications with usable memory (after overhead and penalties)
-    DEVICE_SPECS = {
-        "raspberry_pi": 0.5,  # 0.5GB usable
-        "jetson_nano": 1.0,   # 1GB usable
-        "desktop_pc": 20.0,   # 24GB - 4GB overhead = 20GB usable
-        "aws_server": 60.0    # 64GB - 4GB overhead = 60GB usable
-    }
+    _DEVICE_ITEMS: Final[Tuple[Tuple[str, float], ...]] = (
+        ("raspberry_pi", 0.5),  # 0.5GB usable
+        ("jetson_nano", 1.0),   # 1GB usable
+        ("desktop_pc", 20.0),   # 24GB - 4GB overhead = 20GB usable
+        ("aws_server", 60.0),   # 64GB - 4GB overhead = 60GB usable
+    )
+    # Read-only mapping view of the same specs
+    DEVICE_SPECS: Final[Mapping[str, float]] = MappingProxyType(dict(_DEVICE_ITEMS))
 
     DEFAULT_BYTES_PER_PARAM = 2  # Default to float16
 
+    # Fields that may hold a parameter count, in lookup priority order
+    CONFIG_PARAM_FIELDS: Tuple[str, ...] = (
+        "num_parameters", "n_parameters", "total_params",
+        "parameters", "total_parameters", "model_parameters",
+        "parameter_count", "params", "n_params",
+    )
+    METADATA_PARAM_FIELDS: Tuple[str, ...] = (
+        "num_parameters", "parameters", "total_parameters",
+        "total_params", "model_parameters", "parameter_count",
+        "params", "n_params",
+    )
+
     def evaluate(self, model: ModelData) -> dict[str, float]:
         """
         Evaluate model size compatibility across different devices.
@@ -91,30 +149,43 @@ class SizeMetric(Metric):
                 logger.warning("Could not determine model size")
                 return {device: 0.0 for device in self.DEVICE_SPECS.keys()}
 
-            # Calculate score for each device
-            scores = {}
-            for device, usable_memory in self.DEVICE_SPECS.items():
-                score = (usable_memory - model_size_gb) / usable_memory
-                score = max(0.0, min(1.0, score))  # Clamp between 0 and 1
-                scores[device] = score
+            # Calculate score for each device, clamped between 0 and 1
+            scores = {
+                device: clamp01((usable - model_size_gb) / usable)
+                for device, usable in self._DEVICE_ITEMS
+            }
 
             return scores
 
         except Exception as e:
-            logger.error(f"Error evaluating size metric: {e}")
+            logger.error("Error evaluating size metric: {}", e)
             return {device: 0.0 for device in self.DEVICE_SPECS.keys()}
 
     def _get_model_size(self, model: ModelData) -> Optional[float]:
         """
-        Get model size in GB using: parameter_count * bytes_per_param
-        Uses actual tensor dtype if available, otherwise defaults to float16.
+        Get model size in GB. Metadata fields are tried in order:
+
+        1. `safetensors.parameters` (dtype -> parameter count): exact bytes.
+        2. A parameter count (`safetensors.total`, config/top-level count
+           fields, or the model name) * bytes per param from the dtype,
+           defaulting to float16.
+        3. `usedStorage`: total repo bytes, an overestimate when a repo ships
+           several weight formats, so it is only a last resort.
+
         Returns None if size cannot be determined.
         """
+        metadata = model.hf_metadata
+        if not metadata:
+            logger.warning("No Hugging Face metadata available")
+            return None
+
         try:
-            if not model.hf_metadata:
-                logger.warning("No Hugging Face metadata available")
-                return None
-            metadata = model.hf_metadata
+            # Exact size from the per-dtype safetensors breakdown, when present
+            size_bytes = self._get_safetensors_bytes(metadata)
+            if size_bytes is not None:
+                size_gb = size_bytes / (1024 ** 3)
+                logger.info("Safetensors size: {:.2f}GB", size_gb)
+                return size_gb
 
             # Get parameter count
             param_count = self._get_parameter_count(metadata)
@@ -124,7 +195,7 @@ class SizeMetric(Metric):
                 if "usedStorage" in metadata:
                     size_bytes = metadata["usedStorage"]
                     size_gb = size_bytes / (1024 ** 3)
-                    logger.info(f"Using usedStorage size: {size_gb:.2f}GB")
+                    logger.info("Using usedStorage size: {:.2f}GB", size_gb)
                     return size_gb
                 logger.info("No usedStorage info available")
                 return None
@@ -137,35 +208,52 @@ class SizeMetric(Metric):
             size_gb = size_bytes / (1024 ** 3)
 
             logger.info(
-                f"Model size: {param_count:,} params * {bytes_per_param} \
-                    bytes = {size_gb:.2f}GB"
+                "Model size: {:,} params * {} bytes = {:.2f}GB",
+                param_count, bytes_per_param, size_gb,
             )
             return size_gb
 
         except Exception as e:
-            logger.error(f"Error calculating model size: {e}")
+            logger.error("Error calculating model size: {}", e)
             return None
 
+    def _get_safetensors_bytes(self, metadata: dict) -> Optional[float]:
+        """
+        Sum parameter counts times dtype width over `safetensors.parameters`
+        (e.g. {"BF16": 6.7e9, "F32": 1.2e5}). Unrecognized dtypes count as one
+        byte. Returns None when the breakdown is missing or empty.
+        """
+        safetensors = metadata.get("safetensors")
+        if not isinstance(safetensors, dict):
+            return None
+        parameters = safetensors.get("parameters")
+        if not isinstance(parameters, dict) or not parameters:
+            return None
+
+        total = 0.0
+        for dtype, count in parameters.items():
+            if not isinstance(count, (int, float)) or count < 0:
+                return None
+            total += count * (_dtype_bytes(str(dtype)) or 1)
+        return total if total > 0 else None
+
     def _extract_bytes_from_dtype(self, metadata: dict) -> float:
         """
         Extract bytes per parameter from dtype info.
         Checks safetensors first, then config, then defaults to float16 (2 bytes).
         """
-        import re
-
         try:
             # Check safetensors field for dtype
             if "safetensors" in metadata:
                 safetensors = metadata["safetensors"]
                 if "parameters" in safetensors and safetensors["parameters"]:
                     # Use the first param type directly
-                    dtype = list(safetensors["parameters"].keys())[0]
-                    match = re.search(r'(\d+)', dtype)
-                    if match:
-                        bits = int(match.group(1))
-                        bytes_per_param = bits / 8
+                    dtype = next(iter(safetensors["parameters"]))
+                    bytes_per_param = _dtype_bytes(dtype)
+                    if bytes_per_param is not None:
                         logger.debug(
-                            f"From safetensors '{dtype}': {bytes_per_param} bytes/param"
+                            "From safetensors '{}': {} bytes/param",
+                            dtype, bytes_per_param,
                         )
                         return bytes_per_param
 
@@ -178,13 +266,11 @@ class SizeMetric(Metric):
                 if torch_dtype:
                     # Extract number from dtype name
                     # (e.g., "float16" -> 16, "int8" -> 8)
-                    match = re.search(r'(\d+)', str(torch_dtype))
-                    if match:
-                        bits = int(match.group(1))
-                        bytes_per_param = bits / 8  # Convert bits to bytes
+                    bytes_per_param = _dtype_bytes(str(torch_dtype))
+                    if bytes_per_param is not None:
                         logger.debug(
-                            f"Extracted from torch_dtype '{torch_dtype}': {bits} \
-                                bits = {bytes_per_param} bytes/param"
+                            "Extracted from torch_dtype '{}': {} bytes/param",
+                            torch_dtype, bytes_per_param,
                         )
                         return bytes_per_param
 
@@ -195,13 +281,13 @@ class SizeMetric(Metric):
                         bits = quant_config["bits"]
                         bytes_per_param = bits / 8
                         logger.debug(
-                            f"Found quantization bits: {bits} = \
-                                {bytes_per_param} bytes/param"
+                            "Found quantization bits: {} = {} bytes/param",
+                            bits, bytes_per_param,
                         )
                         return bytes_per_param
 
         except Exception as e:
-            logger.debug(f"Error extracting dtype: {e}")
+            logger.debug("Error extracting dtype: {}", e)
 
         # Default to float16 (2 bytes)
         logger.debug("Using default float16 (2 bytes/param)")
@@ -217,44 +303,31 @@ class SizeMetric(Metric):
                 if "total" in safetensors:
                     param_count = safetensors["total"]
                     if isinstance(param_count, (int, float)) and param_count > 0:
-                        logger.debug(f"Params: {param_count:,} at safetensors.total")
+                        logger.debug("Params: {:,} at safetensors.total", param_count)
                         return int(param_count)
                 elif "parameters" in safetensors and safetensors["parameters"]:
                     # Get first value in parameters dict
                     param_count = list(safetensors["parameters"].values())[0]
                     if isinstance(param_count, (int, float)) and param_count > 0:
-                        logger.debug(f"Params: {param_count:,} safetensors.parameters")
+                        logger.debug("Params: {:,} safetensors.parameters", param_count)
                         return int(param_count)
 
             # Check config
             if "config" in metadata:
-                config = metadata["config"]
-                for field in [
-                    "num_parameters", "n_parameters", "total_params",
-                    "parameters", "total_parameters", "model_parameters",
-                    "parameter_count", "params", "n_params"
-                ]:
-                    if field in config and isinstance(config[field], (int, float)):
-                        param_count: Optional[int] = int(config[field])
-                        if param_count and param_count > 0:
-                            logger.debug(
-                                f"Param count: {param_count:,} at config.{field}"
-                            )
-                            return param_count
+                param_count = self._first_param_field(
+                    metadata["config"], self.CONFIG_PARAM_FIELDS
+                )
+                if param_count:
+                    logger.debug("Param count: {:,} in config", param_count)
+                    return param_count
 
             # Check direct metadata
-            for field in [
-                "num_parameters", "parameters", "total_parameters",
-                "total_params", "model_parameters", "parameter_count",
-                "params", "n_params"
-            ]:
-                if field in metadata and isinstance(metadata[field], (int, float)):
-                    param_count = int(metadata[field])
-                    if param_count > 0:
-                        logger.debug(
-                            f"Found parameter count: {param_count:,} at {field}"
-                        )
-                        return param_count
+            param_count = self._first_param_field(
+                metadata, self.METADATA_PARAM_FIELDS
+            )
+            if param_count:
+                logger.debug("Found parameter count: {:,} in metadata", param_count)
+                return param_count
 
             # Special case: extract from model name patterns
             if "config" in metadata and "name_or_path" in metadata["config"]:
@@ -262,30 +335,39 @@ class SizeMetric(Metric):
                 param_count = self._extract_params_from_name(name)
                 if param_count:
                     logger.debug(
-                        f"Extracted parameter count from name: {param_count:,}"
+                        "Extracted parameter count from name: {:,}", param_count
                     )
                     return param_count
 
             return None
 
         except Exception as e:
-            logger.debug(f"Error extracting parameter count: {e}")
+            logger.debug("Error extracting parameter count: {}", e)
             return None
 
+    def _first_param_field(
+        self, source: dict, fields: Tuple[str, ...]
+    ) -> Optional[int]:
+        """
+        Return the first positive numeric value among `fields` (in priority
+        order). A single key-set intersection skips the scan when none of the
+        fields are present, which is the common case.
+        """
+        present = source.keys() & fields
+        if not present:
+            return None
+        for field in fields:
+            if field in present:
+                value = source[field]
+                if isinstance(value, (int, float)) and int(value) > 0:
+                    return int(value)
+        return None
+
     def _extract_params_from_name(self, model_name: str) -> Optional[int]:
         """Extract parameter count from model name patterns."""
-        import re
-
-        # Single pattern to match: "7b", "3.5B", "70B", "13b", etc.
-        pattern = r'(\d+\.?\d*)[bB]'
-
-        match = re.search(pattern, model_name)
+        match = _PARAM_RX.search(model_name)
         if match:
-            try:
-                num = float(match.group(1))
-                # Convert to actual parameter count (B = billion)
-                return int(num * 1_000_000_000)
-            except ValueError:
-                pass
+            num = float(match.group(1))
+            return int(num * _PARAM_SCALE[match.group(2).lower()])
 
         return None
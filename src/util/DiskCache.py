@@ -0,0 +1,157 @@
+"""
+DiskCache.py
+============
+
+Small persistent key/value cache backed by SQLite, used to avoid repeating
+expensive remote work (such as LLM calls) across CLI invocations.
+
+Responsibilities
+----------------
+- Store JSON-serializable values under string keys in a per-namespace
+  SQLite file.
+- Expire entries after an optional time-to-live.
+- Never let a cache failure break the caller: errors are logged and treated
+  as cache misses.
+
+Typical Flow
+------------
+1. Instantiate `DiskCache("namespace", ttl=seconds)` once at module level.
+2. Call `get(key)`; on `None`, compute the value and `set(key, value)`.
+
+Storage
+-------
+- Files live under ``MODEL_HUB_CACHE_DIR`` (default ``~/.cache/model-hub-cli``)
+  as ``<namespace>.sqlite``.
+- The database runs in WAL mode so concurrent metric threads can read while
+  another thread writes.
+- The path is resolved on every call, so the environment can be changed
+  (e.g. in tests) after the cache object is created.
+- Each thread keeps one open connection per namespace, replaced if the path
+  changes. The schema is created once per path, not on every call.
+- With a TTL, expired entries are deleted when the file is first opened in
+  a process, so the file does not grow without bound.
+
+Testing Notes
+-------------
+- Point ``MODEL_HUB_CACHE_DIR`` at a temporary directory to isolate tests.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+DEFAULT_CACHE_DIR = "~/.cache/model-hub-cli"
+
+# Database paths whose directory, WAL mode and table are already set up, and
+# whose expired entries have been purged
+_INITIALIZED_PATHS: Set[str] = set()
+_INIT_LOCK = threading.Lock()
+
+# Per-thread open connections: namespace -> (path, connection)
+_LOCAL = threading.local()
+
+
+class DiskCache:
+    def __init__(self, namespace: str, ttl: Optional[float] = None) -> None:
+        self.namespace: str = namespace
+        self.ttl: Optional[float] = ttl
+
+    @property
+    def path(self) -> str:
+        cache_dir = os.getenv("MODEL_HUB_CACHE_DIR") or DEFAULT_CACHE_DIR
+        return os.path.join(os.path.expanduser(cache_dir), f"{self.namespace}.sqlite")
+
+    @staticmethod
+    def _thread_connections() -> Dict[str, Tuple[str, sqlite3.Connection]]:
+        conns = getattr(_LOCAL, "conns", None)
+        if conns is None:
+            conns = _LOCAL.conns = {}
+        return conns
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection to the cache file, opening it once."""
+        path = self.path
+        conns = self._thread_connections()
+        held = conns.get(self.namespace)
+        if held is not None:
+            if held[0] == path:
+                return held[1]
+            # The cache directory moved; drop the connection to the old file
+            held[1].close()
+            del conns[self.namespace]
+
+        with _INIT_LOCK:
+            if path not in _INITIALIZED_PATHS:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                init = sqlite3.connect(path, timeout=5)
+                try:
+                    init.execute("PRAGMA journal_mode=WAL")
+                    init.execute(
+                        "CREATE TABLE IF NOT EXISTS cache ("
+                        "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                        "created_at REAL NOT NULL)"
+                    )
+                    if self.ttl is not None:
+                        with init:
+                            init.execute(
+                                "DELETE FROM cache WHERE created_at < ?",
+                                (time.time() - self.ttl,),
+                            )
+                finally:
+                    init.close()
+                _INITIALIZED_PATHS.add(path)
+
+        conn = sqlite3.connect(path, timeout=5)
+        conns[self.namespace] = (path, conn)
+        return conn
+
+    def _discard_connection(self) -> None:
+        """
+        Close this thread's connection after an error, and forget the schema
+        setup, so the next call reopens and re-initializes the file.
+        """
+        held = self._thread_connections().pop(self.namespace, None)
+        if held is not None:
+            held[1].close()
+        with _INIT_LOCK:
+            _INITIALIZED_PATHS.discard(self.path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss or expiry."""
+        try:
+            row = self._connect().execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("DiskCache '{}' read failed: {}", self.namespace, e)
+            self._discard_connection()
+            return None
+
+        if row is None:
+            return None
+
+        value, created_at = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            logger.debug("DiskCache '{}' entry expired: {}", self.namespace, key)
+            return None
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable `value` under `key`."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("DiskCache '{}' write failed: {}", self.namespace, e)
+            self._discard_connection()
@@ -29,6 +29,30 @@ Inputs & Outputs
 - Input: Prompt string to be sent to the LLM.
 - Output: Raw string response from the LLM or a numeric score extracted from it.
 
+Connection Reuse
+----------------
+- All `LLMClient` instances share one pooled `requests.Session`, so metrics
+  issuing back-to-back prompts reuse the same keep-alive TCP/TLS connection.
+- Transient 429/502/503/504 responses are retried up to three times with
+  exponential backoff before the request is treated as failed.
+
+Response Cache
+--------------
+- Completions are cached on disk for a day, keyed by a hash of the model and
+  prompt, so rescoring unchanged inputs costs no API call.
+- Only completions whose first line parses as a score are cached, so a
+  malformed reply is retried on the next run instead of pinning 0.0.
+- Callers that keep their own score cache pass ``cache=False`` so a prompt
+  is never cached twice.
+- Set ``LLM_NOCACHE=1`` to bypass the cache for both reads and writes.
+
+Timeouts
+--------
+- The read timeout adapts to observed latency: 1.5x the p75 of recent
+  successful calls, floored at ``LLM_TIMEOUT`` seconds (default 15).
+- Timed-out or dropped calls are retried with a fresh request, up to three
+  attempts in total.
+
 Error Handling
 --------------
 - Logs API failures, timeouts, and invalid responses.
@@ -41,16 +65,57 @@ Testing Notes
 - Provide sample completions to test `extract_score`.
 """
 
+import hashlib
 import os
-from typing import Optional, Final
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Deque, Final, Optional, Tuple
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.util.DiskCache import DiskCache
+from src.util.scoring import clamp01
+
+# Shared across all LLMClient instances to reuse keep-alive connections.
+# Throttling and gateway errors are retried with backoff; POST is included
+# because a chat completion has no side effects worth guarding. Connect and
+# read failures are left to send_prompt, which retries them with a fresh
+# adaptive timeout.
+_RETRY = Retry(
+    total=3,
+    connect=0,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Completions keyed by sha256(model|prompt), so identical prompts are not
+# re-billed across runs
+_RESPONSE_CACHE = DiskCache("llm_responses", ttl=24 * 60 * 60)
+
+# Latencies (seconds) of recent successful calls, used to size the read timeout
+_LATENCIES: Deque[float] = deque(maxlen=50)
+_LATENCIES_LOCK = threading.Lock()
 
 
 class LLMClient:
     DEFAULT_MODEL: Final[str] = "llama3.1:latest"
     API_URL: Final[str] = "https://genai.rcac.purdue.edu/api/chat/completions"
+    CONNECT_TIMEOUT: Final[float] = 3.05
+    DEFAULT_READ_TIMEOUT: Final[float] = 15.0
+    MAX_ATTEMPTS: Final[int] = 3
+    MIN_LATENCY_SAMPLES: Final[int] = 5
 
     def __init__(self) -> None:
         # Use provided key or fallback to environment variable
@@ -60,26 +125,36 @@ class LLMClient:
                 "GEN_AI_STUDIO_API_KEY is not set. LLM requests may fail."
             )
 
-    def send_prompt(self, prompt: str, model: Optional[str] = None) -> Optional[str]:
-        # Prepare Request Headers and Body
-        headers: dict[str, str] = {
+        # Request headers are the same for every prompt; build them once
+        self._headers: dict[str, str] = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+
+    def send_prompt(
+        self, prompt: str, model: Optional[str] = None, cache: bool = True
+    ) -> Optional[str]:
+        model = model or self.DEFAULT_MODEL
+
+        # Serve identical prompts from the response cache unless disabled
+        use_cache = cache and not os.getenv("LLM_NOCACHE")
+        cache_key = hashlib.sha256(f"{model}|{prompt}".encode("utf-8")).hexdigest()
+        if use_cache:
+            cached: Optional[str] = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM response served from cache")
+                return cached
+
+        # Prepare Request Body
         body: dict[str, object] = {
-            "model": model or self.DEFAULT_MODEL,
+            "model": model,
             "messages": [{"role": "user", "content": prompt}],
             "stream": False,
         }
 
         try:
             # Make the HTTP POST request to the LLM API
-            response: requests.Response = requests.post(
-                self.API_URL,
-                json=body,
-                headers=headers,
-                timeout=10,
-            )
+            response: requests.Response = self._post(body, self._headers)
             response.raise_for_status()
 
             # Parse and return the content from the response
@@ -90,29 +165,96 @@ class LLMClient:
                 .get("content", "")
                 .strip()
             )
-            return content or None
+            if not content:
+                return None
+
+            # Unparseable replies are left uncached so they are retried
+            if use_cache and self.parse_score(content) is not None:
+                _RESPONSE_CACHE.set(cache_key, content)
+            return content
 
         except Exception as e:
-            logger.error(f"Failed to query LLM API: {e}")
+            logger.error("Failed to query LLM API: {}", e)
             return None
 
-    def extract_score(self, response: Optional[str]) -> float:
-        # Return 0.0 if the response is empty or missing
-        if not response:
-            return 0.0
+    def _post(
+        self, body: dict[str, object], headers: dict[str, str]
+    ) -> requests.Response:
+        """
+        POST to the LLM API, abandoning a call that outlives the adaptive
+        timeout and retrying it with a fresh request.
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS):
+            try:
+                return self._post_once(body, headers)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                logger.warning(
+                    "LLM API attempt {} of {} failed ({}); retrying",
+                    attempt, self.MAX_ATTEMPTS, e,
+                )
+        return self._post_once(body, headers)
+
+    def _post_once(
+        self, body: dict[str, object], headers: dict[str, str]
+    ) -> requests.Response:
+        start = time.perf_counter()
+        response = _SESSION.post(
+            self.API_URL, json=body, headers=headers, timeout=self._timeout()
+        )
+        if response.ok:
+            with _LATENCIES_LOCK:
+                _LATENCIES.append(time.perf_counter() - start)
+        return response
 
+    def _timeout(self) -> Tuple[float, float]:
+        """
+        Return the (connect, read) timeout for the next call.
+
+        The read timeout is 1.5x the p75 of recent successful latencies, but
+        never below LLM_TIMEOUT (default 15s). Slow tail responses are cut off
+        and retried instead of stalling the metric.
+        """
         try:
-            # Extract the first line and parse it as a float
-            first_line: str = response.splitlines()[0].strip()
-            score: float = float(first_line)
+            floor = float(os.getenv("LLM_TIMEOUT", self.DEFAULT_READ_TIMEOUT))
+        except ValueError:
+            floor = self.DEFAULT_READ_TIMEOUT
 
-            # Clamp the score to the valid range [0.0, 1.0]
-            if not (0.0 <= score <= 1.0):
-                logger.warning(f"Score out of range: {score}, clamping.")
-                return max(0.0, min(1.0, score))
+        with _LATENCIES_LOCK:
+            samples = list(_LATENCIES)
+        if len(samples) < self.MIN_LATENCY_SAMPLES:
+            return self.CONNECT_TIMEOUT, floor
 
-            return score
+        p75 = statistics.quantiles(samples, n=4)[2]
+        return self.CONNECT_TIMEOUT, max(floor, p75 * 1.5)
 
+    @staticmethod
+    def parse_score(response: Optional[str]) -> Optional[float]:
+        """
+        Parse the first line of a completion as a float, unclamped.
+        Returns None if the response is empty or the line is not a number.
+        """
+        if not response:
+            return None
+
+        try:
+            # Extract the first line (without splitting the rest of the
+            # completion); strip() drops any "\r"
+            return float(response.split("\n", 1)[0].strip())
         except ValueError:
-            logger.warning(f"Could not parse score from response: {response}")
+            return None
+
+    def extract_score(self, response: Optional[str]) -> float:
+        # Return 0.0 if the response is empty or missing
+        if not response:
+            return 0.0
+
+        score = self.parse_score(response)
+        if score is None:
+            logger.warning("Could not parse score from response: {}", response)
             return 0.0
+
+        # Clamp the score to the valid range [0.0, 1.0]
+        clamped = clamp01(score)
+        if clamped != score:
+            logger.warning("Score out of range: {}, clamping.", score)
+        return clamped
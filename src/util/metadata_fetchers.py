@@ -11,7 +11,7 @@ Responsibilities
 - Implementations for:
     - `HuggingFaceFetcher`: Fetches model metadata from Hugging Face API.
     - `GitHubFetcher`: Fetches repository data, license, contributors, stars,
-      forks, and recent commits from GitHub API.
+      forks, and commit count from GitHub API.
     - `DatasetFetcher`: Fetches dataset metadata from Hugging Face datasets API.
 
 
@@ -32,6 +32,32 @@ Error Handling
 - All fetchers return an empty dict `{}` on failure, never `None`.
 
 
+Caching
+-------
+- Successful API JSON responses are cached in memory and on disk (under
+  ``MODEL_HUB_CACHE_DIR``) for an hour.
+- Cache entries are keyed by URL, query parameters and a hash of the
+  request's credentials; pass ``no_cache=True`` to ``fetch_metadata`` to
+  force a fresh request.
+- 404 responses are cached the same way, so a missing model, repo or
+  dataset is not requested again on every run.
+- Expired entries are revalidated with ``If-None-Match``; a 304 renews them
+  without re-downloading the body.
+- When an API call fails with a transient error, the last cached response is
+  served even if it is older than that, up to the disk cache's one-week
+  maximum age. Older entries are misses and are purged from disk.
+- Set ``METADATA_NOCACHE=1`` to bypass the disk cache for both reads and
+  writes.
+- Once a host reports its rate limit exhausted (``X-RateLimit-Remaining: 0``),
+  further calls to it are skipped until ``X-RateLimit-Reset``.
+
+Connection Reuse
+----------------
+- Fetchers without an injected session share one module-level pooled
+  `requests.Session` (32 connections per host, GET retries on 429/5xx).
+- `prewarm_connections()` opens connections to both API hosts in the
+  background so the first fetches reuse them.
+
 Testing
 -------
 - Each fetcher is injectable with a `requests.Session` for easier testing/mocking.
@@ -46,26 +72,305 @@ Notes
     formats.
 """
 
-from typing import Any, Dict, Optional
-from urllib.parse import urlparse
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
-from huggingface_hub import hf_hub_download
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.util.DiskCache import DiskCache
+
+
+def hf_hub_download(repo_id: str, filename: str) -> str:
+    """
+    Download a file via huggingface_hub, importing it on first use. The
+    package is slow to import and is only needed when a direct fetch fails.
+    """
+    from huggingface_hub import hf_hub_download as _hf_hub_download
+
+    return _hf_hub_download(repo_id=repo_id, filename=filename)
+
+
+# Shared by every fetcher that isn't given a session, so HF and GitHub calls
+# across models reuse one pool of keep-alive connections. Transient errors on
+# GETs are retried with backoff; Retry-After is ignored so a rate-limited API
+# can't stall the CLI for minutes.
+_DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+_DEFAULT_ADAPTER = HTTPAdapter(
+    pool_connections=32, pool_maxsize=32, max_retries=_DEFAULT_RETRY
+)
+_DEFAULT_SESSION = requests.Session()
+_DEFAULT_SESSION.mount("https://", _DEFAULT_ADAPTER)
+
+# API hosts worth connecting to before the first fetch needs them
+_PREWARM_URLS = ("https://huggingface.co", "https://api.github.com")
+
+
+def prewarm_connections() -> None:
+    """
+    Open pooled connections to the metadata hosts on background threads, so
+    the first fetches skip the TCP/TLS handshake. Failures are ignored; the
+    real request will simply connect as usual.
+    """
+    def warm(url: str) -> None:
+        try:
+            _DEFAULT_SESSION.head(url, timeout=2)
+        except requests.RequestException as e:
+            logger.debug("Connection prewarm to {} failed: {}", url, e)
+
+    for url in _PREWARM_URLS:
+        threading.Thread(target=warm, args=(url,), daemon=True).start()
+
+
+# Hugging Face text files fetched at a pinned commit, keyed by
+# (repo_id, revision, filename). A commit's files never change, so entries
+# (including None for a file the commit lacks) stay valid for the process.
+_HF_FILE_CACHE: Dict[Tuple[str, str, str], Optional[str]] = {}
+_HF_FILE_CACHE_LOCK = threading.Lock()
+
+# Statuses on a direct file GET that mean the repo is gated or private
+_HF_AUTH_STATUSES = frozenset({401, 403})
+
+
+# Supported URL shapes. The host must match exactly (so lookalikes such as
+# huggingface.co.example.net are rejected); the trailing groups are optional
+# so a supported host with a short path can be reported as malformed.
+_HOST_END = r"(?::443)?(?=[/?#]|$)"
+_HF_MODEL_URL_RX = re.compile(
+    r"^https?://(?:www\.)?huggingface\.co" + _HOST_END
+    + r"(?:/+([^/?#]+)/+([^/?#]+))?",
+    re.IGNORECASE,
+)
+_HF_DATASET_URL_RX = re.compile(
+    r"^https?://(?:www\.)?huggingface\.co" + _HOST_END
+    + r"(?:/+datasets/+([^/?#]+)/+([^/?#]+))?",
+    re.IGNORECASE,
+)
+_GITHUB_URL_RX = re.compile(
+    r"^https?://(?:www\.)?github\.com" + _HOST_END
+    + r"(?:/+([^/?#]+)/+([^/?#]+))?",
+    re.IGNORECASE,
+)
+
+# Parsed JSON of successful metadata GETs, keyed by (url, params, credential
+# fingerprint) so responses fetched with different tokens never mix, and held for
+# an hour so re-evaluating the same model, repo or dataset in one process
+# costs no network. Values are (expires_at, data); the oldest entry is evicted
+# once the cache is full.
+_JsonCacheKey = Tuple[str, Tuple[Tuple[str, Any], ...], str]
+_JSON_CACHE: Dict[_JsonCacheKey, Tuple[float, Any]] = {}
+_JSON_CACHE_LOCK = threading.Lock()
+_JSON_CACHE_TTL = 60 * 60
+_JSON_CACHE_MAXSIZE = 2048
+
+# The same responses persisted across runs as {"fetched_at", "data", "etag"}.
+# Entries younger than _JSON_CACHE_TTL are served directly; older ones are
+# revalidated with their ETag and still served when the upstream API fails,
+# until they reach _JSON_DISK_CACHE_MAX_AGE and are dropped.
+_JSON_DISK_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+_JSON_DISK_CACHE = DiskCache("metadata_json", ttl=_JSON_DISK_CACHE_MAX_AGE)
+
+# Statuses treated as transient upstream trouble (403 covers GitHub's
+# rate limiting) for which a stale cached response beats no data at all
+_STALE_IF_ERROR_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+
+# Hosts whose API rate limit is exhausted, mapped to the epoch time it resets.
+# Until then further calls would only burn a round trip each on a 403/429.
+_RATE_LIMITED_UNTIL: Dict[str, float] = {}
+_RATE_LIMIT_FALLBACK_WAIT = 60
+
+# Page number in a GitHub Link header's rel="last" entry
+_LAST_PAGE_RX = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _json_body(resp: requests.Response) -> Any:
+    return resp.json()
+
+
+def _item_count(resp: requests.Response) -> int:
+    """
+    Total items in a GitHub list requested with per_page=1: the last page
+    number from the Link header, or the size of the only page if there is none.
+    """
+    match = _LAST_PAGE_RX.search(resp.headers.get("Link", ""))
+    if match:
+        return int(match.group(1))
+    return len(resp.json())
+
+
+def _note_rate_limit(host: str, resp: requests.Response) -> None:
+    """Record `host` as rate limited if the response exhausted its budget."""
+    if resp.headers.get("X-RateLimit-Remaining") != "0":
+        return
+    reset = time.time() + _RATE_LIMIT_FALLBACK_WAIT
+    reset_header = resp.headers.get("X-RateLimit-Reset")
+    if reset_header is not None:
+        try:
+            reset = float(reset_header)
+        except ValueError:
+            pass
+    _RATE_LIMITED_UNTIL[host] = reset
+    logger.warning(
+        "Rate limit exhausted for {}; skipping calls until {}",
+        host,
+        time.strftime("%H:%M:%S", time.localtime(reset)),
+    )
+
+
+def _auth_fingerprint(headers: Optional[Dict[str, str]]) -> str:
+    """Short, non-reversible stand-in for the request's credentials."""
+    auth = (headers or {}).get("Authorization")
+    if not auth:
+        return ""
+    return hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16]
+
+
+def _remember_json(cache_key: _JsonCacheKey, data: Any, ttl: float) -> None:
+    with _JSON_CACHE_LOCK:
+        if cache_key not in _JSON_CACHE and len(_JSON_CACHE) >= _JSON_CACHE_MAXSIZE:
+            del _JSON_CACHE[next(iter(_JSON_CACHE))]
+        _JSON_CACHE[cache_key] = (time.monotonic() + ttl, copy.deepcopy(data))
+
+
+def _get_json(
+    session: requests.Session,
+    api_url: str,
+    what: str,
+    source_url: str,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    parse: Callable[[requests.Response], Any] = _json_body,
+    refresh: bool = False,
+) -> Optional[Any]:
+    """
+    GET `api_url` and return its parsed JSON (or whatever `parse` extracts
+    from the response), or None on failure. Successful results are memoized
+    in memory and on disk; callers get their own copy and may mutate it. If
+    the request fails transiently, the last cached result is returned even if
+    it is stale. `refresh` skips fresh cache entries and always asks upstream.
+    """
+    cache_key = (
+        api_url, tuple(sorted((params or {}).items())), _auth_fingerprint(headers)
+    )
+    with _JSON_CACHE_LOCK:
+        entry = None if refresh else _JSON_CACHE.get(cache_key)
+    if entry is not None and entry[0] > time.monotonic():
+        logger.debug("{} for {} served from cache", what, source_url)
+        return copy.deepcopy(entry[1])
+
+    # The disk cache can be switched off; the in-process cache stays on
+    use_disk = not os.getenv("METADATA_NOCACHE")
+    disk_key = "|".join(map(str, cache_key))
+    stored = _JSON_DISK_CACHE.get(disk_key) if use_disk else None
+    if stored is not None and not refresh:
+        age = time.time() - stored["fetched_at"]
+        if age < _JSON_CACHE_TTL:
+            logger.debug("{} for {} served from disk cache", what, source_url)
+            _remember_json(cache_key, stored["data"], _JSON_CACHE_TTL - age)
+            return stored["data"]
+
+    host = api_url.split("/", 3)[2]
+    if _RATE_LIMITED_UNTIL.get(host, 0.0) > time.time():
+        logger.debug("Skipping {} for {}: {} is rate limited", what, source_url, host)
+        return _stale(stored, what, source_url)
+
+    # Revalidate a stale entry instead of downloading it again; a 304 costs
+    # no body transfer, no parsing and (on GitHub) no rate limit budget
+    etag = stored.get("etag") if stored is not None else None
+    if etag:
+        headers = {**(headers or {}), "If-None-Match": etag}
+
+    kwargs: Dict[str, Any] = {"timeout": 5}
+    if headers:
+        kwargs["headers"] = headers
+    if params:
+        kwargs["params"] = params
+
+    logger.debug("Fetching {} from: {}", what, api_url)
+    try:
+        resp = session.get(api_url, **kwargs)
+        _note_rate_limit(host, resp)
+        if etag and stored is not None and resp.status_code == 304:
+            logger.debug("{} for {} not modified", what, source_url)
+            data = stored["data"]
+        elif resp.status_code == 404:
+            # A missing repo is an answer too; remember it like any other
+            logger.warning("{} not found for {}", what, source_url)
+            data, etag = None, None
+        elif not resp.ok:
+            logger.warning(
+                "Failed to fetch {} (HTTP {}) for {}",
+                what, resp.status_code, source_url,
+            )
+            if resp.status_code in _STALE_IF_ERROR_STATUSES:
+                return _stale(stored, what, source_url)
+            return None
+        else:
+            data = parse(resp)
+            etag = resp.headers.get("ETag")
+    except Exception as e:
+        logger.exception("Exception fetching {}: {}", what, e)
+        return _stale(stored, what, source_url)
+
+    _remember_json(cache_key, data, _JSON_CACHE_TTL)
+    if use_disk:
+        record = {"fetched_at": time.time(), "data": data}
+        if isinstance(etag, str):
+            record["etag"] = etag
+        _JSON_DISK_CACHE.set(disk_key, record)
+    return data
+
+
+def _stale(stored: Optional[Dict[str, Any]], what: str, source_url: str) -> Any:
+    """Return stale cached data after a failed fetch, or None if there is none."""
+    if stored is None:
+        return None
+    logger.info("Serving stale cached {} for {}", what, source_url)
+    return stored["data"]
 
 
 class MetadataFetcher:
-    def fetch_metadata(self, url: Optional[str]) -> Dict[str, Any]:
-        """Fetch metadata from the given URL."""
+    __slots__ = ()
+
+    def fetch_metadata(
+        self, url: Optional[str], no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fetch metadata from the given URL. `no_cache` bypasses cached API
+        responses and forces a fresh request.
+        """
         raise NotImplementedError("Must be implemented by subclasses.")
 
 
 class HuggingFaceFetcher(MetadataFetcher):
+    __slots__ = ("session",)
+
+    BASE_API_URL = "https://huggingface.co/api/models"
+    BASE_FILE_URL = "https://huggingface.co"
+
     def __init__(self, session: Optional[requests.Session] = None) -> None:
-        self.session = session or requests.Session()
-        self.BASE_API_URL = "https://huggingface.co/api/models"
+        self.session = session or _DEFAULT_SESSION
 
-    def fetch_metadata(self, url: Optional[str]) -> Dict[str, Any]:
+    def fetch_metadata(
+        self, url: Optional[str], no_cache: bool = False
+    ) -> Dict[str, Any]:
         """Fetch Hugging Face model metadata."""
         metadata = {}
 
@@ -77,72 +382,134 @@ class HuggingFaceFetcher(MetadataFetcher):
 
         # Verify URL is a HuggingFace Model URL
         # - Should Always Be a HuggingFace Model URL
-        parsed = urlparse(url)
-        if "huggingface.co" not in parsed.netloc:
-            logger.error(f"Unsupported model URL: {url}")
+        match = _HF_MODEL_URL_RX.match(url)
+        if match is None:
+            logger.error("Unsupported model URL: {}", url)
             return metadata
 
-        # Parse URL to Extract Organization ID and Model ID
+        # Extract Organization ID and Model ID
         # - Expect URL Format: huggingface.co/{organization}/{model_id}
-        parts = parsed.path.strip("/").split("/")
-        if len(parts) < 2:
-            logger.warning(f"Malformed HuggingFace model URL: {url}")
+        organization, model_id = match.groups()
+        if model_id is None:
+            logger.warning("Malformed HuggingFace model URL: {}", url)
             return metadata
 
-        organization, model_id = parts[0], parts[1]
-        api_url = f"{self.BASE_API_URL}/{organization}/{model_id}"
         repo_id = f"{organization}/{model_id}"
+        api_url = f"{self.BASE_API_URL}/{repo_id}"
 
         # Fetch General Model Metadata from Hugging Face API
-        try:
-            logger.debug(f"Fetching HF metadata from: {api_url}")
-            resp = self.session.get(api_url, timeout=5)
+        model_data = _get_json(
+            self.session, api_url, "HF metadata", url, refresh=no_cache
+        )
+        if model_data is not None:
+            logger.debug("HF metadata retrieved for model: {}", model_id)
+            metadata = model_data
+
+        # Fetch README.md and model_index.json concurrently (both are I/O-bound),
+        # pinned to the commit the API reported so repeat fetches are cached
+        revision = metadata.get("sha") or "main"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            readme_future = executor.submit(
+                self._download_text, repo_id, "README.md", revision
+            )
+            model_index_future = executor.submit(
+                self._download_text, repo_id, "model_index.json", revision
+            )
+            readme = readme_future.result()
+            model_index = model_index_future.result()
+
+        if readme is not None:
+            metadata["readme"] = readme
+        if model_index is not None:
+            # Parse once here so consumers get structured data
+            try:
+                metadata["model_index"] = json.loads(model_index)
+            except ValueError:
+                logger.debug("model_index.json for {} is not valid JSON", repo_id)
 
-            if resp.ok:
-                logger.debug(f"HF metadata retrieved for model: {model_id}")
-                metadata = resp.json()
-            else:
-                logger.warning(
-                    f"Failed to retrieve HF metadata (HTTP {resp.status_code}) "
-                    f"for {url}"
+        return metadata
+
+    def _download_text(
+        self, repo_id: str, filename: str, revision: str = "main"
+    ) -> Optional[str]:
+        """Download a text file from a Hugging Face repo, or None on failure."""
+        cache_key = (repo_id, revision, filename)
+        with _HF_FILE_CACHE_LOCK:
+            if cache_key in _HF_FILE_CACHE:
+                logger.debug(
+                    "{} for {}@{} served from cache", filename, repo_id, revision
                 )
-        except Exception as e:
-            logger.exception(f"Exception fetching HF metadata: {e}")
+                return _HF_FILE_CACHE[cache_key]
 
-        # Fetch README.md
+        # A single GET skips hf_hub_download's cache locking and HEAD probe
+        file_url = f"{self.BASE_FILE_URL}/{repo_id}/resolve/{revision}/{filename}"
         try:
-            readme_path = hf_hub_download(repo_id=repo_id, filename="README.md")
-            with open(readme_path, "r", encoding="utf-8") as f:
-                metadata["readme"] = f.read()
-                logger.debug("Successfully fetched README.md from Hugging Face")
+            resp = self.session.get(file_url, timeout=5)
+            if resp.ok:
+                logger.debug("Successfully fetched {} from Hugging Face", filename)
+                self._remember(cache_key, resp.text)
+                return resp.text
+            if resp.status_code == 404:
+                logger.debug("{} not found for {}", filename, repo_id)
+                self._remember(cache_key, None)
+                return None
+            if resp.status_code not in _HF_AUTH_STATUSES:
+                logger.warning(
+                    "Failed to fetch {} (HTTP {}) for {}",
+                    filename, resp.status_code, repo_id,
+                )
+                return None
         except Exception as e:
-            logger.warning(f"Failed to fetch README.md via huggingface_hub: {e}")
+            logger.warning("Failed to fetch {} for {}: {}", filename, repo_id, e)
+            return None
 
-        # Fetch model_index.json
+        # Gated or private repos need the locally stored hub token; only then
+        # is it worth going through huggingface_hub and its on-disk cache
+        logger.debug("{} for {} needs auth; using huggingface_hub", filename, repo_id)
         try:
-            model_index_path = hf_hub_download(
-                repo_id=repo_id, filename="model_index.json"
-            )
-            with open(model_index_path, "r", encoding="utf-8") as f:
-                metadata["model_index"] = f.read()
-                logger.debug("Successfully fetched model_index.json from Hugging Face")
+            path = hf_hub_download(repo_id=repo_id, filename=filename)
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            logger.debug("Successfully fetched {} via huggingface_hub", filename)
+            return text
         except Exception as e:
-            logger.warning(f"Failed to fetch model_index.json via huggingface_hub: {e}")
+            logger.warning("Failed to fetch {} via huggingface_hub: {}", filename, e)
+            return None
 
-        return metadata
+    @staticmethod
+    def _remember(cache_key: Tuple[str, str, str], text: Optional[str]) -> None:
+        # Only commit-pinned fetches are cached; "main" can move under us
+        if cache_key[1] != "main":
+            with _HF_FILE_CACHE_LOCK:
+                _HF_FILE_CACHE[cache_key] = text
 
 
 class GitHubFetcher(MetadataFetcher):
+    __slots__ = ("token", "session", "_headers")
+
+    BASE_API_URL = "https://api.github.com/repos"
+    # GitHub lists contributors by contribution count, and BusFactorMetric
+    # only scores the top ten, so one short page is all that is needed
+    TOP_CONTRIBUTORS = 10
+    # commits_count has always been one 100-item page, and CodeQualityMetric's
+    # commit score is calibrated to that range
+    MAX_COMMITS_COUNT = 100
+
     def __init__(
         self,
         token: Optional[str] = None,
         session: Optional[requests.Session] = None
     ) -> None:
         self.token = token
-        self.session = session or requests.Session()
-        self.BASE_API_URL = "https://api.github.com/repos"
-
-    def fetch_metadata(self, url: Optional[str]) -> Dict[str, Any]:
+        self.session = session or _DEFAULT_SESSION
+        # Shared by every request this fetcher makes; _get_json never mutates it
+        self._headers = {"Accept": "application/vnd.github.v3+json"}
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+
+    def fetch_metadata(
+        self, url: Optional[str], no_cache: bool = False
+    ) -> Dict[str, Any]:
         """Fetch GitHub repository metadata."""
         metadata = {}
 
@@ -154,88 +521,73 @@ class GitHubFetcher(MetadataFetcher):
 
         # Verify URL is a Valid GitHub URL
         # - May Not Be a GitHub URL if Unsupported Code Link Provided
-        parsed = urlparse(url)
-        if "github.com" not in parsed.netloc:
-            logger.info(f"URL is not a GitHub URL: {url}")
+        match = _GITHUB_URL_RX.match(url)
+        if match is None:
+            logger.info("URL is not a GitHub URL: {}", url)
             return metadata
 
-        # Parse URL to Extract Owner and Repository Name
+        # Extract Owner and Repository Name
         # - Expect URL Format: github.com/{owner}/{repo}
-        parts = parsed.path.strip("/").split("/")
-        if len(parts) < 2:
-            logger.warning(f"Malformed GitHub URL: {url}")
+        owner, repo = match.groups()
+        if repo is None:
+            logger.warning("Malformed GitHub URL: {}", url)
             return metadata
 
-        owner, repo = parts[0], parts[1]
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+        # The three endpoints are independent, so fetch them concurrently
+        base_url = f"{self.BASE_API_URL}/{owner}/{repo}"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            contributors_future = executor.submit(
+                _get_json, self.session, base_url + "/contributors",
+                "GitHub contributors", url, self._headers,
+                {"per_page": self.TOP_CONTRIBUTORS}, refresh=no_cache,
+            )
+            repo_future = executor.submit(
+                _get_json, self.session, base_url,
+                "GitHub repository info", url, self._headers, refresh=no_cache,
+            )
+            # One commit per page makes the last page number the total count
+            commits_future = executor.submit(
+                _get_json, self.session, base_url + "/commits",
+                "GitHub commits", url, self._headers, {"per_page": 1}, _item_count,
+                refresh=no_cache,
+            )
+            contributors = contributors_future.result()
+            repo_data = repo_future.result()
+            commits_count = commits_future.result()
 
         try:
-            # Fetch contributors
-            contributors_url = f"{self.BASE_API_URL}/{owner}/{repo}/contributors"
-            logger.debug(f"Fetching GitHub contributors from: {contributors_url}")
-            resp = self.session.get(contributors_url, headers=headers, timeout=5)
-            if resp.ok:
-                metadata["contributors"] = resp.json()
-            else:
-                logger.warning(
-                    f"Failed to fetch contributors (HTTP {resp.status_code}) for {url}"
-                )
-
-            # Fetch license
-            license_url = f"{self.BASE_API_URL}/{owner}/{repo}/license"
-            logger.debug(f"Fetching GitHub license from: {license_url}")
-            resp = self.session.get(license_url, headers=headers, timeout=5)
-            if resp.ok:
-                license = resp.json().get("license", {}).get("spdx_id")
-                metadata["license"] = license
-            else:
-                logger.warning(
-                    f"Failed to fetch license (HTTP {resp.status_code}) for {url}"
-                )
-
-            # Fetch repository info
-            repo_url = f"{self.BASE_API_URL}/{owner}/{repo}"
-            logger.debug(f"Fetching GitHub repository info from: {repo_url}")
-            resp = self.session.get(repo_url, headers=headers, timeout=5)
-            if resp.ok:
-                repo_data = resp.json()
+            if contributors is not None:
+                metadata["contributors"] = contributors
+            if repo_data is not None:
+                # The repo payload carries the same license detection as the
+                # /license endpoint, minus the license file body
+                if repo_data.get("license"):
+                    metadata["license"] = repo_data["license"].get("spdx_id")
                 metadata["clone_url"] = repo_data.get("clone_url")
                 metadata["stargazers_count"] = repo_data.get("stargazers_count", 0)
                 metadata["forks_count"] = repo_data.get("forks_count", 0)
-            else:
-                logger.warning(
-                    f"Failed to fetch repository info (HTTP {resp.status_code}) "
-                    f"for {url}"
-                )
-
-            # Fetch recent commit activity
-            commits_url = f"{self.BASE_API_URL}/{owner}/{repo}/commits"
-            logger.debug(f"Fetching GitHub commits from: {commits_url}")
-            params = {"per_page": 100}
-            commits_resp = self.session.get(commits_url, params=params, headers=headers)
-            if commits_resp.ok:
-                commits = commits_resp.json()
-                metadata["commits_count"] = len(commits)
-            else:
-                logger.warning(
-                    f"Failed to fetch commits (HTTP {resp.status_code}) for {url}"
+            if commits_count is not None:
+                metadata["commits_count"] = min(
+                    commits_count, self.MAX_COMMITS_COUNT
                 )
-
         except Exception as e:
-            logger.exception(f"Exception fetching GitHub metadata: {e}")
+            logger.exception("Exception parsing GitHub metadata: {}", e)
 
         return metadata
 
 
 class DatasetFetcher(MetadataFetcher):
     """Fetches dataset metadata from Hugging Face datasets API."""
+    __slots__ = ("session",)
+
+    BASE_API_URL = "https://huggingface.co/api/datasets"
+
     def __init__(self, session: Optional[requests.Session] = None) -> None:
-        self.session = session or requests.Session()
-        self.BASE_API_URL = "https://huggingface.co/api/datasets"
+        self.session = session or _DEFAULT_SESSION
 
-    def fetch_metadata(self, url: Optional[str]) -> Dict[str, Any]:
+    def fetch_metadata(
+        self, url: Optional[str], no_cache: bool = False
+    ) -> Dict[str, Any]:
         metadata = {}
 
         # Verify URL Exists
@@ -246,33 +598,25 @@ class DatasetFetcher(MetadataFetcher):
 
         # Verify URL is a HuggingFace Dataset URL
         # - May Not Be a HuggingFace URL if Unsupported Dataset Link Provided
-        parsed = urlparse(url)
-        if parsed.netloc != "huggingface.co":
-            logger.warning(f"Unsupported dataset URL domain: {url}")
+        match = _HF_DATASET_URL_RX.match(url)
+        if match is None:
+            logger.warning("Unsupported dataset URL domain: {}", url)
             return metadata
 
-        # Parse URL to Extract Organization and Dataset ID
+        # Extract Organization and Dataset ID
         # - Expect URL Format: huggingface.co/datasets/{organization}/{dataset_id}
-        parts = parsed.path.strip("/").split("/")
-        if len(parts) < 3 or parts[0] != "datasets":
-            logger.warning(f"Malformed dataset URL path: {url}")
+        organization, dataset_id = match.groups()
+        if dataset_id is None:
+            logger.warning("Malformed dataset URL path: {}", url)
             return metadata
 
-        organization, dataset_id = parts[1], parts[2]
         api_url = f"{self.BASE_API_URL}/{organization}/{dataset_id}"
 
         # Fetch Metadata from HuggingFace Datasets API
-        try:
-            logger.debug(f"Fetching HF dataset metadata from: {api_url}")
-            resp = self.session.get(api_url, timeout=5)
-            if resp.ok:
-                metadata = resp.json()
-            else:
-                logger.warning(
-                    f"Failed to retrieve HF dataset metadata (HTTP {resp.status_code}) "
-                    f"for {url}"
-                )
-        except Exception as e:
-            logger.exception(f"Exception fetching HF dataset metadata: {e}")
+        dataset_data = _get_json(
+            self.session, api_url, "HF dataset metadata", url, refresh=no_cache
+        )
+        if dataset_data is not None:
+            metadata = dataset_data
 
         return metadata
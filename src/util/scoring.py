@@ -0,0 +1,12 @@
+"""
+scoring.py
+==========
+
+Small numeric helpers shared by metrics that produce 0.0–1.0 scores.
+"""
+
+
+def clamp01(x: float) -> float:
+    """Clamp `x` to [0.0, 1.0]; NaN becomes 0.0."""
+    # "not x >= 0.0" also sends NaN to 0.0
+    return 0.0 if not x >= 0.0 else (1.0 if x > 1.0 else x)
@@ -11,13 +11,14 @@ import pytest
 from src.Model import Model
 
 
-@dataclass
+@dataclass(slots=True)
 class StubModelData:
     modelLink: str
     codeLink: Optional[str]
     datasetLink: Optional[str]
     _hf_metadata: Optional[Dict[str, Any]] = None
     _github_metadata: Optional[Dict[str, Any]] = None
+    _dataset_metadata: Optional[Dict[str, Any]] = None
 
     @property
     def hf_metadata(self) -> Optional[Dict[str, Any]]:
@@ -66,11 +67,12 @@ def sample_model(sample_urls) -> Model:
     return Model(sample_urls)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_urls() -> list[str]:
     """
     Fixture that provides a sample list of model, dataset, and code URLs.
-    Used to simulate bundled input.
+    Used to simulate bundled input. Built once per session; treat it as
+    read-only.
     """
     return [
         'https://github.com/huggingface/transformers',       # codeLink
@@ -94,3 +96,15 @@ def intercept_loguru_logs(caplog):
     logger.add(PropagateHandler(), level="DEBUG")
     yield
     logger.remove()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """
+    Point on-disk caches at a per-test directory and start each test with
+    empty in-process caches, so tests never share state.
+    """
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr("src.util.metadata_fetchers._HF_FILE_CACHE", {})
+    monkeypatch.setattr("src.util.metadata_fetchers._JSON_CACHE", {})
+    monkeypatch.setattr("src.util.metadata_fetchers._RATE_LIMITED_UNTIL", {})
@@ -4,6 +4,12 @@ from src.metrics.AvailabilityMetric import AvailabilityMetric
 from tests.conftest import StubModelData
 
 
+@pytest.fixture(scope="module")
+def metric():
+    # AvailabilityMetric holds no state, so one instance serves every test
+    return AvailabilityMetric()
+
+
 @pytest.mark.parametrize(
     "code_link, dataset_link, github_meta, dataset_meta, expected_score",
     [
@@ -59,6 +65,7 @@ from tests.conftest import StubModelData
     ],
 )
 def test_availability_metric_scores(
+    metric,
     code_link,
     dataset_link,
     github_meta,
@@ -73,11 +80,11 @@ def test_availability_metric_scores(
     model.github_metadata = github_meta
     model.dataset_metadata = dataset_meta
     model.hf_metadata = {}
-    score = AvailabilityMetric().evaluate(model)
+    score = metric.evaluate(model)
     assert pytest.approx(score, 0.01) == expected_score
 
 
-def test_availability_metric_none_metadata():
+def test_availability_metric_none_metadata(metric):
     model = StubModelData(
         modelLink="https://huggingface.co/org/model",
         codeLink="https://github.com/org/repo",
@@ -86,5 +93,5 @@ def test_availability_metric_none_metadata():
     model.github_metadata = None
     model.dataset_metadata = None
     model.hf_metadata = {}
-    score = AvailabilityMetric().evaluate(model)
+    score = metric.evaluate(model)
     assert score == 0.0
@@ -112,6 +112,13 @@ class TestDatasetQualityMetric:
         assert metric._parse_score("") is None
         assert metric._parse_score("no numbers here") is None
 
+    def test_parse_score_no_digits_skips_regex(
+        self, metric: DatasetQualityMetric
+    ) -> None:
+        with patch("src.metrics.DatasetQualityMetric.re.findall") as mock_findall:
+            assert metric._parse_score("The dataset looks solid.") is None
+        mock_findall.assert_not_called()
+
     def test_create_quality_prompt(self, metric: DatasetQualityMetric) -> None:
         metadata = {"id": "test/dataset", "description": "Test"}
         prompt = metric._create_quality_prompt(metadata)
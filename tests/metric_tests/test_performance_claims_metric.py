@@ -70,3 +70,23 @@ def test_llm_score_invalid_metadata(metric):
     score = metric.evaluate(model)
     assert score == 0.0
 
+
+def test_full_readme_is_sent_to_llm(metric, hf_model):
+    """The whole README reaches the LLM, not a keyword-selected excerpt."""
+    readme = "# My Model\n\nA friendly model for chatting.\n\n## License\n\nMIT"
+    hf_model._hf_metadata["readme"] = readme
+    metric.llm_client.extract_score.return_value = 0.4
+    metric.evaluate(hf_model)
+    prompt = metric.llm_client.send_prompt.call_args.args[0]
+    assert f"README:\n{readme}\n\n" in prompt
+
+
+def test_no_documentation_skips_llm(metric):
+    """Models without card data or README never reach the LLM."""
+    model = StubModelData(
+        modelLink="https://example.com/org/model", codeLink=None, datasetLink=None
+    )
+    model._hf_metadata = {}
+    score = metric.evaluate(model)
+    assert score == 0.0
+    metric.llm_client.send_prompt.assert_not_called()
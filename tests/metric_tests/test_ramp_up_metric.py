@@ -32,6 +32,8 @@ class TestRampUpMetric:
         prompt_arg = self.metric.llm.send_prompt.call_args[0][0]
         assert readme in prompt_arg
         self.metric.llm.extract_score.assert_called_once()
+        # The score cache replaces the client's response cache for this prompt
+        assert self.metric.llm.send_prompt.call_args.kwargs == {"cache": False}
 
     def test_evaluate_with_no_docs_returns_zero(self):
         model = StubModelData(
@@ -47,3 +49,89 @@ class TestRampUpMetric:
         assert score == 0.0
         self.metric.llm.send_prompt.assert_not_called()
         self.metric.llm.extract_score.assert_not_called()
+
+    def test_evaluate_reuses_cached_score(self):
+        model = StubModelData(
+            modelLink="https://huggingface.co/org/model",
+            codeLink=None,
+            datasetLink=None,
+            _hf_metadata={"readme": "Cached README content"},
+        )
+        self.metric.llm.send_prompt.return_value = "0.8"
+        self.metric.llm.extract_score.return_value = 0.8
+
+        first = self.metric.evaluate(model)
+        second = self.metric.evaluate(model)
+
+        assert first == second == 0.8
+        self.metric.llm.send_prompt.assert_called_once()
+
+    def test_evaluate_does_not_cache_failed_query(self):
+        model = StubModelData(
+            modelLink="https://huggingface.co/org/model",
+            codeLink=None,
+            datasetLink=None,
+            _hf_metadata={"readme": "Flaky README content"},
+        )
+        self.metric.llm.send_prompt.return_value = None
+        self.metric.llm.extract_score.return_value = 0.0
+
+        self.metric.evaluate(model)
+        self.metric.evaluate(model)
+
+        assert self.metric.llm.send_prompt.call_count == 2
+
+    def test_evaluate_does_not_cache_unparseable_reply(self):
+        model = StubModelData(
+            modelLink="https://huggingface.co/org/model",
+            codeLink=None,
+            datasetLink=None,
+            _hf_metadata={"readme": "Chatty README content"},
+        )
+        self.metric.llm.send_prompt.return_value = "The score is 0.7\n0.7"
+        self.metric.llm.extract_score.return_value = 0.0
+
+        self.metric.evaluate(model)
+        self.metric.evaluate(model)
+
+        assert self.metric.llm.send_prompt.call_count == 2
+
+    def test_cache_key_ignores_case_and_whitespace(self):
+        key = self.metric._cache_key("## Usage\n\nRun   the model")
+        assert key == self.metric._cache_key("## usage\nrun the MODEL ")
+        assert key != self.metric._cache_key("## Usage\nTrain the model")
+
+    def test_classify_heading_prefers_earlier_sections(self):
+        # "data" (Dataset) outranks "training" even though it appears later
+        assert self.metric._classify_heading("training data") == "Dataset"
+        assert self.metric._classify_heading("how to use") == "Usage"
+        assert self.metric._classify_heading("how to fine-tune") == "Training"
+        assert self.metric._classify_heading("license") is None
+
+    def test_extract_relevant_sections_returns_short_readme_unchanged(self):
+        readme = "# Model\n## License\nMIT"
+        assert self.metric._extract_relevant_sections(readme) == readme
+
+    def test_extract_relevant_sections_keeps_first_matching_sections(self):
+        readme = (
+            "# Model\n" + "intro " * 20
+            + "\n## Usage\nrun it\n## License\nMIT\n### Training data\nlots\n"
+            + "## Usage examples\nignored duplicate\n"
+        )
+        result = self.metric._extract_relevant_sections(readme, max_tokens=25)
+        assert result == "## Usage\nrun it\n\n## Dataset\nlots"
+
+    def test_extract_relevant_sections_shares_budget_across_sections(self):
+        readme = "## Usage\n" + "u" * 1000 + "\n## Setup\npip install x\n"
+        result = self.metric._extract_relevant_sections(readme, max_tokens=50)
+
+        assert len(result) <= 200
+        # The short section survives whole despite the long one before it
+        assert result.endswith("## Installation\npip install x")
+        assert result.startswith("## Usage\nuuu")
+
+    def test_fit_sections_stays_within_small_budget(self):
+        sections = ["## Usage\nrun it", "## Setup\npip install x", "## Data\nlots"]
+        for max_chars in range(4, 20):
+            fitted = self.metric._fit_sections(sections, max_chars)
+            assert len("\n\n".join(fitted)) <= max_chars
@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch
 from typing import Optional, Any
 from src.metrics.SizeMetric import SizeMetric
 from src.ModelData import ModelData
+from tests.conftest import StubModelData
 
 
 class TestSizeMetric:
@@ -129,6 +130,49 @@ class TestSizeMetric:
         assert size_gb is not None
         assert 6.0 <= size_gb <= 7.0  # 7B * 1 byte ≈ 6.5GB
 
+    def test_get_model_size_from_safetensors_breakdown(
+        self, metric: SizeMetric, mock_model: Mock
+    ) -> None:
+        """Mixed-dtype safetensors counts give an exact byte total."""
+        mock_model.hf_metadata = {
+            "safetensors": {
+                "parameters": {"BF16": 1024 ** 3, "F32": 1024 ** 3 // 2},
+                "total": 3 * 1024 ** 3 // 2,
+            },
+            "config": {"num_parameters": 70_000_000_000},
+        }
+        # 1Gi * 2 bytes + 0.5Gi * 4 bytes = 4GB, ignoring the config count
+        assert metric._get_model_size(mock_model) == 4.0
+
+    def test_get_safetensors_bytes_missing_or_invalid(
+        self, metric: SizeMetric
+    ) -> None:
+        assert metric._get_safetensors_bytes({}) is None
+        assert metric._get_safetensors_bytes({"safetensors": {"total": 10}}) is None
+        assert (
+            metric._get_safetensors_bytes(
+                {"safetensors": {"parameters": {"F16": "many"}}}
+            )
+            is None
+        )
+        assert (
+            metric._get_safetensors_bytes({"safetensors": {"parameters": {"BOOL": 8}}})
+            == 8
+        )
+
+    def test_evaluate_stub_model_data(self, metric: SizeMetric) -> None:
+        """Slotted, unhashable models are scored like any other."""
+        model = StubModelData(
+            modelLink="https://huggingface.co/org/model",
+            codeLink=None,
+            datasetLink=None,
+            _hf_metadata={"config": {"num_parameters": 1_000_000}},
+        )
+
+        first = metric.evaluate(model)
+        assert all(score > 0.0 for score in first.values())
+        assert metric.evaluate(model) == first
+
     def test_get_model_size_no_params(
         self, metric: SizeMetric, mock_model: Mock
     ) -> None:
@@ -146,6 +190,9 @@ class TestSizeMetric:
             ("int8", 1.0),
             ("int4", 0.5),
             ("bfloat16", 2.0),
+            ("torch.float16", 2.0),
+            ("half", 2.0),
+            ("double", 8.0),
             ("", 2.0),
             (None, 2.0),  # Defaults
         ],
@@ -185,6 +232,16 @@ class TestSizeMetric:
         for metadata, expected in test_cases:
             assert metric._get_parameter_count(metadata) == expected
 
+    def test_get_parameter_count_field_priority(self, metric: SizeMetric) -> None:
+        """Earlier fields win, and invalid values fall through to later ones."""
+        config = {"params": 1_000, "num_parameters": 2_000}
+        assert metric._get_parameter_count({"config": config}) == 2_000
+
+        config = {"num_parameters": "invalid", "n_params": 3_000}
+        assert metric._get_parameter_count({"config": config}) == 3_000
+
+        assert metric._get_parameter_count({"parameters": 4_000}) == 4_000
+
     def test_get_parameter_count_from_name(self, metric: SizeMetric) -> None:
         """Test parameter extraction from model name fallback."""
         metadata = {"config": {"name_or_path": "meta-llama/Llama-2-7b-hf"}}
@@ -215,7 +272,12 @@ class TestSizeMetric:
             ("gpt-3.5b", 3_500_000_000),
             ("model-13B", 13_000_000_000),
             ("falcon-40b-instruct", 40_000_000_000),
-            ("bert-110M", None),  # 'M' not supported, only 'b'/'B'
+            ("bert-110M", 110_000_000),
+            ("opt-125m", 125_000_000),
+            ("switch-1.6T", 1_600_000_000_000),
+            ("phi-3-mini-4k-instruct", None),  # 'k' is context length
+            ("llama_7b_chat", 7_000_000_000),
+            ("bert-base", None),
             ("no-params-here", None),
             ("model-7.5b-chat", 7_500_000_000),
             ("70B-model", 70_000_000_000),
@@ -1,14 +1,19 @@
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
-from src.util.LLMClient import LLMClient
+from src.util import LLMClient as llm_module
+from src.util.LLMClient import LLMClient, _SESSION
 
 
 class TestLLMClient:
     @pytest.fixture(autouse=True)
     def setup(self):
+        llm_module._LATENCIES.clear()
         self.client = LLMClient()
+        yield
+        llm_module._LATENCIES.clear()
 
-    @patch("src.util.LLMClient.requests.post")
+    @patch("src.util.LLMClient._SESSION.post")
     def test_send_prompt_success(self, mock_post):
         # Arrange: mock a successful HTTP response with valid JSON content
         mock_response = MagicMock()
@@ -30,7 +35,7 @@ class TestLLMClient:
         assert "Authorization" in headers_passed
         assert headers_passed["Authorization"].startswith("Bearer ")
 
-    @patch("src.util.LLMClient.requests.post")
+    @patch("src.util.LLMClient._SESSION.post")
     def test_send_prompt_http_error(self, mock_post):
         # Arrange: simulate an HTTP error
         mock_response = MagicMock()
@@ -43,7 +48,7 @@ class TestLLMClient:
         assert result is None
         mock_post.assert_called_once()
 
-    @patch("src.util.LLMClient.requests.post")
+    @patch("src.util.LLMClient._SESSION.post")
     def test_send_prompt_invalid_json(self, mock_post):
         # Arrange: simulate a response that raises an exception when calling .json()
         mock_response = MagicMock()
@@ -57,6 +62,93 @@ class TestLLMClient:
         assert result is None
         mock_post.assert_called_once()
 
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_reuses_cached_response(self, mock_post):
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "0.9"}}]
+        }
+        mock_post.return_value = mock_response
+
+        assert self.client.send_prompt("Same prompt") == "0.9"
+        assert LLMClient().send_prompt("Same prompt") == "0.9"
+        mock_post.assert_called_once()
+
+        # A different model is a different cache entry
+        self.client.send_prompt("Same prompt", model="other:latest")
+        assert mock_post.call_count == 2
+
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_cache_can_be_disabled(self, mock_post, monkeypatch):
+        monkeypatch.setenv("LLM_NOCACHE", "1")
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "0.9"}}]
+        }
+        mock_post.return_value = mock_response
+
+        self.client.send_prompt("Same prompt")
+        self.client.send_prompt("Same prompt")
+        assert mock_post.call_count == 2
+
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_does_not_cache_unparseable_reply(self, mock_post):
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "I would rate this 0.9"}}]
+        }
+        mock_post.return_value = mock_response
+
+        self.client.send_prompt("Chatty prompt")
+        self.client.send_prompt("Chatty prompt")
+        assert mock_post.call_count == 2
+
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_cache_can_be_skipped_per_call(self, mock_post):
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "0.9"}}]
+        }
+        mock_post.return_value = mock_response
+
+        self.client.send_prompt("Uncached prompt", cache=False)
+        self.client.send_prompt("Uncached prompt")
+        assert mock_post.call_count == 2
+
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_retries_after_timeout(self, mock_post):
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "0.5"}}]
+        }
+        mock_post.side_effect = [requests.ReadTimeout("slow"), mock_response]
+
+        assert self.client.send_prompt("Test prompt") == "0.5"
+        assert mock_post.call_count == 2
+
+    @patch("src.util.LLMClient._SESSION.post")
+    def test_send_prompt_gives_up_after_max_attempts(self, mock_post):
+        mock_post.side_effect = requests.ConnectionError("down")
+
+        assert self.client.send_prompt("Test prompt") is None
+        assert mock_post.call_count == LLMClient.MAX_ATTEMPTS
+
+    def test_timeout_uses_floor_until_enough_samples(self, monkeypatch):
+        monkeypatch.setenv("LLM_TIMEOUT", "20")
+        llm_module._LATENCIES.extend([30.0] * (LLMClient.MIN_LATENCY_SAMPLES - 1))
+        assert self.client._timeout() == (LLMClient.CONNECT_TIMEOUT, 20.0)
+
+    def test_timeout_adapts_to_observed_latency(self, monkeypatch):
+        monkeypatch.delenv("LLM_TIMEOUT", raising=False)
+        llm_module._LATENCIES.extend([20.0] * 10)
+        assert self.client._timeout() == (LLMClient.CONNECT_TIMEOUT, 30.0)
+
+    def test_session_retries_transient_post_failures(self):
+        retry = _SESSION.get_adapter(LLMClient.API_URL).max_retries
+        assert retry.total == 3
+        assert retry.is_retry("POST", 503)
+        assert not retry.is_retry("POST", 400)
+
     def test_extract_score_valid_float(self):
         response = "0.85\nAdditional info"
         score = self.client.extract_score(response)
@@ -72,6 +164,9 @@ class TestLLMClient:
         score = self.client.extract_score(response)
         assert score == 0.0  # Clamped to 0.0
 
+    def test_extract_score_nan(self):
+        assert self.client.extract_score("nan") == 0.0
+
     def test_extract_score_empty_response(self):
         score = self.client.extract_score("")
         assert score == 0.0
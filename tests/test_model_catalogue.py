@@ -1,5 +1,7 @@
 import json
 
+import pytest
+import requests
 from unittest.mock import MagicMock
 
 from src.Metric import Metric
@@ -8,6 +10,17 @@ from src.Model import Model
 from src.ModelCatalogue import ModelCatalogue
 
 
+@pytest.fixture
+def offline_metadata(monkeypatch):
+    """Answer every metadata request with a 404 so tests stay off the network."""
+    not_found = requests.Response()
+    not_found.status_code = 404
+    monkeypatch.setattr(
+        "src.util.metadata_fetchers._DEFAULT_SESSION.get",
+        MagicMock(return_value=not_found),
+    )
+
+
 class StubMetric(Metric):
     """Metric that returns a constant float value."""
 
@@ -51,6 +64,10 @@ def test_add_model_adds_to_internal_list(sample_model):
 def test_evaluate_models_runs_all_metrics(sample_model):
     catalogue = ModelCatalogue()
     sample_model.computeNetScore = MagicMock()
+    # Metadata already loaded, so the prefetch stays off the network
+    sample_model._hf_metadata = {}
+    sample_model._github_metadata = {}
+    sample_model._dataset_metadata = {}
 
     catalogue.metrics = [
         StubMetric1("StubMetric1", 0.3),
@@ -66,7 +83,60 @@ def test_evaluate_models_runs_all_metrics(sample_model):
     sample_model.computeNetScore.assert_called_once()
 
 
-def test_generate_report_format(sample_model):
+def test_evaluate_models_prefetches_metadata_before_scoring():
+    events = []
+
+    def make_model(name):
+        model = MagicMock()
+        for source in ModelCatalogue.METADATA_SOURCES:
+            setattr(type(model), source, property(
+                lambda self, source=source: events.append(f"{source} {name}") or {}
+            ))
+        model.evaluate_all.side_effect = lambda metrics, fetch: events.append(
+            f"evaluate {name}"
+        )
+        return model
+
+    catalogue = ModelCatalogue()
+    for name in ("a", "b", "c"):
+        catalogue.addModel(make_model(name))
+    catalogue.evaluateModels()
+
+    for name in ("a", "b", "c"):
+        for source in ModelCatalogue.METADATA_SOURCES:
+            assert events.index(f"{source} {name}") < events.index(f"evaluate {name}")
+    for model in catalogue.models:
+        model.evaluate_all.assert_called_once()
+        assert model.evaluate_all.call_args.args[0] is catalogue.metrics
+
+
+def test_evaluate_models_charges_fetch_time_to_metric_latencies(sample_model):
+    catalogue = ModelCatalogue()
+    sample_model._hf_metadata = {}
+    sample_model._github_metadata = {}
+    sample_model._dataset_metadata = {}
+    # Stubs named after the real metrics, so their metadata sources apply
+    catalogue.metrics = [
+        type(name, (StubMetric,), {})()
+        for name in ("RampUpMetric", "CodeQualityMetric", "LicenseMetric")
+    ] + [StubMetric1()]
+    fetch_seconds = {"hf_metadata": 0.5, "github_metadata": 0.25}
+    catalogue._prefetchMetadata = lambda model, source: fetch_seconds.get(
+        source, 0.0
+    )
+
+    catalogue.addModel(sample_model)
+    catalogue.evaluateModels()
+
+    latency = sample_model.evaluationsLatency
+    assert 0.5 <= latency["RampUpMetric"] < 0.6
+    assert 0.25 <= latency["CodeQualityMetric"] < 0.35
+    assert 0.75 <= latency["LicenseMetric"] < 0.85
+    assert latency["StubMetric1"] < 0.1
+    assert sample_model.getLatency("RampUpMetric") >= 500
+
+
+def test_generate_report_format(sample_model, offline_metadata):
     catalogue = ModelCatalogue()
 
     # Mock computeNetScore to avoid needing full metrics
@@ -123,7 +193,7 @@ def test_generate_report_format(sample_model):
     ), f"Missing keys: {expected_keys - model_json.keys()}"
 
 
-def test_get_model_ndjson_defaults(sample_model):
+def test_get_model_ndjson_defaults(sample_model, offline_metadata):
     catalogue = ModelCatalogue()
     ndjson_str = catalogue.getModelNDJSON(sample_model)
     data = json.loads(ndjson_str)
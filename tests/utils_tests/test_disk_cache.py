@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+from unittest.mock import patch
+
+from src.util.DiskCache import DiskCache
+
+
+def test_disk_cache_roundtrip():
+    cache = DiskCache("test_roundtrip")
+    cache.set("key", {"score": 0.5})
+    assert cache.get("key") == {"score": 0.5}
+
+
+def test_disk_cache_miss_returns_none():
+    cache = DiskCache("test_miss")
+    assert cache.get("missing") is None
+
+
+def test_disk_cache_uses_cache_dir_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(tmp_path))
+    cache = DiskCache("test_env")
+    cache.set("key", 1)
+    assert (tmp_path / "test_env.sqlite").exists()
+
+
+def test_disk_cache_expired_entry_is_a_miss():
+    cache = DiskCache("test_ttl", ttl=60)
+    with patch("src.util.DiskCache.time.time", return_value=1000.0):
+        cache.set("key", "value")
+    with patch("src.util.DiskCache.time.time", return_value=1030.0):
+        assert cache.get("key") == "value"
+    with patch("src.util.DiskCache.time.time", return_value=1061.0):
+        assert cache.get("key") is None
+
+
+def test_disk_cache_unwritable_dir_is_a_miss(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(blocker))
+    cache = DiskCache("test_unwritable")
+    cache.set("key", "value")
+    assert cache.get("key") is None
+
+
+def test_disk_cache_reuses_connection_per_thread():
+    cache = DiskCache("test_reuse")
+    with patch(
+        "src.util.DiskCache.sqlite3.connect", wraps=sqlite3.connect
+    ) as connect:
+        for i in range(5):
+            cache.set(f"key{i}", i)
+            assert cache.get(f"key{i}") == i
+    # One connection for the schema setup, one kept open for this thread
+    assert connect.call_count == 2
+
+    # Another thread opens its own connection without redoing the schema
+    with patch(
+        "src.util.DiskCache.sqlite3.connect", wraps=sqlite3.connect
+    ) as connect:
+        worker = threading.Thread(target=cache.get, args=("key0",))
+        worker.start()
+        worker.join()
+    assert connect.call_count == 1
+
+
+def test_disk_cache_follows_cache_dir_change(tmp_path, monkeypatch):
+    cache = DiskCache("test_moved")
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(tmp_path / "a"))
+    cache.set("key", "a")
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(tmp_path / "b"))
+    assert cache.get("key") is None
+    cache.set("key", "b")
+    monkeypatch.setenv("MODEL_HUB_CACHE_DIR", str(tmp_path / "a"))
+    assert cache.get("key") == "a"
+
+
+def test_disk_cache_recovers_from_deleted_file():
+    cache = DiskCache("test_deleted")
+    cache.set("key", "value")
+    # Close the open connection but leave the schema marked as set up
+    cache._thread_connections().pop("test_deleted")[1].close()
+    os.remove(cache.path)
+
+    # The read hits the missing table, and the failure resets the setup
+    assert cache.get("key") is None
+    cache.set("key", "again")
+    assert cache.get("key") == "again"
+
+
+def test_disk_cache_purges_expired_entries_on_open():
+    cache = DiskCache("test_purge", ttl=60)
+    with patch("src.util.DiskCache.time.time", return_value=1000.0):
+        cache.set("old", "value")
+    with patch("src.util.DiskCache.time.time", return_value=1050.0):
+        cache.set("new", "value")
+
+    # Simulate a fresh process opening the file
+    cache._discard_connection()
+    with patch("src.util.DiskCache.time.time", return_value=1070.0):
+        assert cache.get("new") == "value"
+
+    with sqlite3.connect(cache.path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM cache")]
+    assert keys == ["new"]
@@ -1,25 +1,121 @@
-from unittest.mock import MagicMock
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from src.util import metadata_fetchers
 from src.util.metadata_fetchers import HuggingFaceFetcher, GitHubFetcher, DatasetFetcher
 
 
+def route_by_url(responses):
+    """Build a session.get side effect that answers by URL (404 otherwise)."""
+    def get(url, *args, **kwargs):
+        return responses.get(url, MagicMock(ok=False, status_code=404))
+    return get
+
+
 # HuggingFaceFetcher Tests
 def test_huggingface_fetcher_success():
     session = MagicMock()
     mock_response = MagicMock()
     mock_response.ok = True
     mock_response.json.return_value = {"id": "model-id", "downloads": 1000}
-    session.get.return_value = mock_response
+    session.get.side_effect = route_by_url({
+        "https://huggingface.co/api/models/organization/model-id": mock_response,
+    })
 
     fetcher = HuggingFaceFetcher(session=session)
     url = "https://huggingface.co/organization/model-id"
     metadata = fetcher.fetch_metadata(url)
 
-    session.get.assert_called_once_with(
+    session.get.assert_any_call(
         "https://huggingface.co/api/models/organization/model-id", timeout=5
     )
     assert metadata == {"id": "model-id", "downloads": 1000}
 
 
+def test_huggingface_fetcher_fetches_readme_directly():
+    session = MagicMock()
+    api_response = MagicMock(ok=True)
+    api_response.json.return_value = {"id": "org/model"}
+    readme_response = MagicMock(ok=True, text="# Model card")
+    session.get.side_effect = route_by_url({
+        "https://huggingface.co/api/models/org/model": api_response,
+        "https://huggingface.co/org/model/resolve/main/README.md": readme_response,
+    })
+
+    fetcher = HuggingFaceFetcher(session=session)
+    with patch("src.util.metadata_fetchers.hf_hub_download") as mock_download:
+        metadata = fetcher.fetch_metadata("https://huggingface.co/org/model")
+
+    # 404 on model_index.json is final; no hub fallback is attempted
+    mock_download.assert_not_called()
+    assert metadata == {"id": "org/model", "readme": "# Model card"}
+
+
+def test_huggingface_fetcher_caches_files_pinned_to_commit():
+    session = MagicMock()
+    api_response = MagicMock(ok=True)
+    api_response.json.return_value = {"id": "org/pinned", "sha": "abc123"}
+    readme_response = MagicMock(ok=True, text="# Pinned card")
+    session.get.side_effect = route_by_url({
+        "https://huggingface.co/api/models/org/pinned": api_response,
+        "https://huggingface.co/org/pinned/resolve/abc123/README.md": readme_response,
+    })
+
+    fetcher = HuggingFaceFetcher(session=session)
+    first = fetcher.fetch_metadata("https://huggingface.co/org/pinned")
+    second = fetcher.fetch_metadata("https://huggingface.co/org/pinned")
+
+    assert first == second
+    assert first["readme"] == "# Pinned card"
+    # API JSON, README and the 404'd model_index are all served from cache
+    assert session.get.call_count == 3
+
+
+def test_huggingface_fetcher_falls_back_to_hub_download(tmp_path):
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=False, status_code=401)
+    readme_file = tmp_path / "README.md"
+    readme_file.write_text("# Gated model", encoding="utf-8")
+
+    fetcher = HuggingFaceFetcher(session=session)
+    with patch(
+        "src.util.metadata_fetchers.hf_hub_download",
+        side_effect=lambda repo_id, filename: (
+            str(readme_file) if filename == "README.md" else None
+        ),
+    ):
+        metadata = fetcher.fetch_metadata("https://huggingface.co/org/model")
+
+    assert metadata == {"readme": "# Gated model"}
+
+
+def test_huggingface_fetcher_parses_model_index():
+    session = MagicMock()
+    index_response = MagicMock(ok=True, text='{"name": "model"}')
+    session.get.side_effect = route_by_url({
+        "https://huggingface.co/org/model/resolve/main/model_index.json": (
+            index_response
+        ),
+    })
+
+    fetcher = HuggingFaceFetcher(session=session)
+    metadata = fetcher.fetch_metadata("https://huggingface.co/org/model")
+
+    assert metadata == {"model_index": {"name": "model"}}
+
+
+def test_huggingface_fetcher_skips_hub_download_on_server_error():
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=False, status_code=503)
+
+    fetcher = HuggingFaceFetcher(session=session)
+    with patch("src.util.metadata_fetchers.hf_hub_download") as mock_download:
+        metadata = fetcher.fetch_metadata("https://huggingface.co/org/model")
+
+    mock_download.assert_not_called()
+    assert metadata == {}
+
+
 def test_huggingface_fetcher_invalid_url_missing_path():
     session = MagicMock()
     fetcher = HuggingFaceFetcher(session=session)
@@ -49,7 +145,8 @@ def test_huggingface_fetcher_http_failure():
     metadata = fetcher.fetch_metadata("https://huggingface.co/org/model")
 
     assert metadata == {}
-    session.get.assert_called_once()
+    # API metadata, README.md, and model_index.json
+    assert session.get.call_count == 3
 
 
 def test_huggingface_fetcher_no_url():
@@ -62,6 +159,14 @@ def test_huggingface_fetcher_no_url():
 
 
 # GitHubFetcher Tests
+LAST_PAGE_150 = (
+    '<https://api.github.com/repositories/1/commits?per_page=1&page=2>; '
+    'rel="next", '
+    '<https://api.github.com/repositories/1/commits?per_page=1&page=150>; '
+    'rel="last"'
+)
+
+
 def test_github_fetcher_success():
     session = MagicMock()
 
@@ -69,28 +174,24 @@ def test_github_fetcher_success():
     contrib_response = MagicMock(ok=True)
     contrib_response.json.return_value = [{"login": "alice"}, {"login": "bob"}]
 
-    # Mock license response
-    license_response = MagicMock(ok=True)
-    license_response.json.return_value = {"license": {"spdx_id": "MIT"}}
-
     # Mock repository response
     repo_response = MagicMock(ok=True)
     repo_response.json.return_value = {
         "clone_url": "https://github.com/org/repo.git",
         "stargazers_count": 100,
         "forks_count": 50,
+        "license": {"key": "mit", "spdx_id": "MIT"},
     }
 
     # Mock commit activity response
-    commit_response = MagicMock(ok=True)
-    commit_response.json.return_value = [{}] * 150  # 150 commits
+    commit_response = MagicMock(ok=True, headers={"Link": LAST_PAGE_150})
+    commit_response.json.return_value = [{}]
 
-    session.get.side_effect = [
-        contrib_response,
-        license_response,
-        repo_response,
-        commit_response,
-    ]
+    session.get.side_effect = route_by_url({
+        "https://api.github.com/repos/org/repo/contributors": contrib_response,
+        "https://api.github.com/repos/org/repo": repo_response,
+        "https://api.github.com/repos/org/repo/commits": commit_response,
+    })
 
     fetcher = GitHubFetcher(session=session)
     url = "https://github.com/org/repo"
@@ -102,9 +203,73 @@ def test_github_fetcher_success():
         "clone_url": "https://github.com/org/repo.git",
         "stargazers_count": 100,
         "forks_count": 50,
-        "commits_count": 150,
+        # 150 commits upstream, capped at the old single-page count
+        "commits_count": 100,
     }
-    assert session.get.call_count == 4
+    assert session.get.call_count == 3
+    session.get.assert_any_call(
+        "https://api.github.com/repos/org/repo/contributors",
+        timeout=5,
+        headers={"Accept": "application/vnd.github.v3+json"},
+        params={"per_page": 10},
+    )
+
+
+def test_github_fetcher_counts_single_page_of_commits():
+    session = MagicMock()
+    commit_response = MagicMock(ok=True, headers={})
+    commit_response.json.return_value = [{}]
+    session.get.side_effect = route_by_url({
+        "https://api.github.com/repos/org/repo/commits": commit_response,
+    })
+
+    metadata = GitHubFetcher(session=session).fetch_metadata(
+        "https://github.com/org/repo"
+    )
+
+    assert metadata == {"commits_count": 1}
+    session.get.assert_any_call(
+        "https://api.github.com/repos/org/repo/commits",
+        timeout=5,
+        headers={"Accept": "application/vnd.github.v3+json"},
+        params={"per_page": 1},
+    )
+
+
+def test_github_fetcher_stops_calling_once_rate_limited():
+    session = MagicMock()
+    exhausted = MagicMock(
+        ok=False,
+        status_code=403,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4000"},
+    )
+    session.get.return_value = exhausted
+    fetcher = GitHubFetcher(session=session)
+
+    with patch("src.util.metadata_fetchers.time") as mock_time:
+        mock_time.monotonic.return_value = mock_time.time.return_value = 1000.0
+        fetcher.fetch_metadata("https://github.com/org/repo")
+        calls_before = session.get.call_count
+        metadata = fetcher.fetch_metadata("https://github.com/org/other")
+
+    assert metadata == {}
+    assert session.get.call_count == calls_before
+
+
+@pytest.mark.parametrize("headers", [
+    {"X-RateLimit-Remaining": "0"},
+    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "soon"},
+])
+def test_rate_limit_without_usable_reset_waits_fallback(headers):
+    with patch("src.util.metadata_fetchers.time") as mock_time:
+        mock_time.time.return_value = 1000.0
+        metadata_fetchers._note_rate_limit(
+            "api.github.com", MagicMock(headers=headers)
+        )
+
+    assert metadata_fetchers._RATE_LIMITED_UNTIL["api.github.com"] == (
+        1000.0 + metadata_fetchers._RATE_LIMIT_FALLBACK_WAIT
+    )
 
 
 def test_github_fetcher_invalid_url_not_github():
@@ -133,28 +298,24 @@ def test_github_fetcher_partial_failure():
     # Contributors fetch fails
     contrib_response = MagicMock(ok=False, status_code=403)
 
-    # License fetch succeeds
-    license_response = MagicMock(ok=True)
-    license_response.json.return_value = {"license": {"spdx_id": "Apache-2.0"}}
-
     # Repository response succeeds
     repo_response = MagicMock(ok=True)
     repo_response.json.return_value = {
         "clone_url": "https://github.com/org/repo.git",
         "stargazers_count": 100,
         "forks_count": 50,
+        "license": {"key": "apache-2.0", "spdx_id": "Apache-2.0"},
     }
 
     # Commit response succeeds
-    commit_response = MagicMock(ok=True)
-    commit_response.json.return_value = [{}] * 150  # 150 commits
+    commit_response = MagicMock(ok=True, headers={"Link": LAST_PAGE_150})
+    commit_response.json.return_value = [{}]
 
-    session.get.side_effect = [
-        contrib_response,
-        license_response,
-        repo_response,
-        commit_response,
-    ]
+    session.get.side_effect = route_by_url({
+        "https://api.github.com/repos/org/repo/contributors": contrib_response,
+        "https://api.github.com/repos/org/repo": repo_response,
+        "https://api.github.com/repos/org/repo/commits": commit_response,
+    })
 
     fetcher = GitHubFetcher(session=session)
     metadata = fetcher.fetch_metadata("https://github.com/org/repo")
@@ -164,9 +325,29 @@ def test_github_fetcher_partial_failure():
         "clone_url": "https://github.com/org/repo.git",
         "stargazers_count": 100,
         "forks_count": 50,
-        "commits_count": 150,
+        "commits_count": 100,
     }
-    assert session.get.call_count == 4
+    assert session.get.call_count == 3
+
+
+def test_github_fetcher_endpoint_exception_keeps_other_fields():
+    session = MagicMock()
+    repo_response = MagicMock(ok=True)
+    repo_response.json.return_value = {"clone_url": "c", "stargazers_count": 1}
+
+    def get(url, *args, **kwargs):
+        if url.endswith("/commits"):
+            raise ConnectionError("reset")
+        return route_by_url({
+            "https://api.github.com/repos/org/repo": repo_response,
+        })(url)
+    session.get.side_effect = get
+
+    fetcher = GitHubFetcher(session=session)
+    metadata = fetcher.fetch_metadata("https://github.com/org/repo")
+
+    assert metadata == {"clone_url": "c", "stargazers_count": 1, "forks_count": 0}
+    assert session.get.call_count == 3
 
 
 def test_github_fetcher_no_url():
@@ -245,3 +426,253 @@ def test_dataset_fetcher_no_url():
 
     metadata = fetcher.fetch_metadata(None)
     assert metadata == {}
+
+
+# Metadata JSON cache
+def test_dataset_fetcher_reuses_cached_json():
+    session = MagicMock()
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"id": "org/dataset"}
+    session.get.return_value = mock_response
+
+    fetcher = DatasetFetcher(session=session)
+    first = fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+    first["mutated"] = True
+    second = fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+
+    assert second == {"id": "org/dataset"}
+    session.get.assert_called_once()
+
+
+def test_failed_fetch_is_not_cached():
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=False, status_code=503)
+
+    fetcher = DatasetFetcher(session=session)
+    fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+    fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+
+    assert session.get.call_count == 2
+
+
+def test_not_found_is_cached():
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=False, status_code=404)
+
+    fetcher = DatasetFetcher(session=session)
+    first = fetcher.fetch_metadata("https://huggingface.co/datasets/org/missing")
+    second = fetcher.fetch_metadata("https://huggingface.co/datasets/org/missing")
+
+    assert first == second == {}
+    session.get.assert_called_once()
+
+
+def test_json_cache_entries_expire():
+    session = MagicMock()
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"id": "org/dataset"}
+    session.get.return_value = mock_response
+    fetcher = DatasetFetcher(session=session)
+
+    with patch("src.util.metadata_fetchers.time") as mock_time:
+        mock_time.monotonic.return_value = mock_time.time.return_value = 0.0
+        fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+        mock_time.monotonic.return_value = mock_time.time.return_value = 7200.0
+        fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+
+    assert session.get.call_count == 2
+
+
+def test_no_cache_forces_a_fresh_request():
+    session = MagicMock()
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"id": "org/dataset"}
+    session.get.return_value = mock_response
+    fetcher = DatasetFetcher(session=session)
+
+    fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+    fetcher.fetch_metadata(
+        "https://huggingface.co/datasets/org/dataset", no_cache=True
+    )
+
+    assert session.get.call_count == 2
+
+
+def test_json_cache_is_keyed_by_token():
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=True, headers={})
+    session.get.return_value.json.return_value = {}
+
+    GitHubFetcher(token="a", session=session).fetch_metadata(
+        "https://github.com/org/repo"
+    )
+    GitHubFetcher(token="b", session=session).fetch_metadata(
+        "https://github.com/org/repo"
+    )
+    GitHubFetcher(token="a", session=session).fetch_metadata(
+        "https://github.com/org/repo"
+    )
+
+    # Three endpoints per token; the repeat of token "a" is served from cache
+    assert session.get.call_count == 6
+
+
+def test_json_cache_persists_across_processes():
+    session = MagicMock()
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"id": "org/dataset"}
+    session.get.return_value = mock_response
+    fetcher = DatasetFetcher(session=session)
+
+    fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+    metadata_fetchers._JSON_CACHE.clear()  # simulate a fresh process
+    metadata = fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+
+    assert metadata == {"id": "org/dataset"}
+    session.get.assert_called_once()
+
+
+def test_expired_entry_is_revalidated_with_etag():
+    session = MagicMock()
+    ok_response = MagicMock(ok=True, headers={"ETag": 'W/"abc"'})
+    ok_response.json.return_value = {"id": "org/dataset"}
+    not_modified = MagicMock(ok=True, status_code=304, headers={})
+    session.get.side_effect = [ok_response, not_modified]
+    fetcher = DatasetFetcher(session=session)
+
+    with patch("src.util.metadata_fetchers.time") as mock_time:
+        mock_time.monotonic.return_value = mock_time.time.return_value = 0.0
+        fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+        mock_time.monotonic.return_value = mock_time.time.return_value = 7200.0
+        metadata = fetcher.fetch_metadata(
+            "https://huggingface.co/datasets/org/dataset"
+        )
+
+    assert metadata == {"id": "org/dataset"}
+    not_modified.json.assert_not_called()
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": 'W/"abc"'}
+
+
+@pytest.mark.parametrize("status, expected", [
+    (503, {"id": "org/dataset"}),  # transient: serve stale
+    (404, {}),                     # gone: don't
+])
+def test_stale_response_served_only_on_transient_errors(status, expected):
+    session = MagicMock()
+    ok_response = MagicMock(ok=True)
+    ok_response.json.return_value = {"id": "org/dataset"}
+    session.get.side_effect = [
+        ok_response, MagicMock(ok=False, status_code=status)
+    ]
+    fetcher = DatasetFetcher(session=session)
+
+    with patch("src.util.metadata_fetchers.time") as mock_time:
+        mock_time.monotonic.return_value = mock_time.time.return_value = 0.0
+        fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+        mock_time.monotonic.return_value = mock_time.time.return_value = 7200.0
+        metadata = fetcher.fetch_metadata(
+            "https://huggingface.co/datasets/org/dataset"
+        )
+
+    assert metadata == expected
+    assert session.get.call_count == 2
+
+
+def test_stale_response_not_served_past_max_age():
+    session = MagicMock()
+    ok_response = MagicMock(ok=True)
+    ok_response.json.return_value = {"id": "org/dataset"}
+    session.get.side_effect = [ok_response, MagicMock(ok=False, status_code=503)]
+    fetcher = DatasetFetcher(session=session)
+    too_old = metadata_fetchers._JSON_DISK_CACHE_MAX_AGE + 1.0
+
+    with patch("src.util.metadata_fetchers.time") as mock_time, \
+            patch("src.util.DiskCache.time.time") as disk_time:
+        mock_time.monotonic.return_value = mock_time.time.return_value = 0.0
+        disk_time.return_value = 0.0
+        fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+        mock_time.monotonic.return_value = mock_time.time.return_value = too_old
+        disk_time.return_value = too_old
+        metadata = fetcher.fetch_metadata(
+            "https://huggingface.co/datasets/org/dataset"
+        )
+
+    assert metadata == {}
+    assert session.get.call_count == 2
+
+
+def test_metadata_nocache_env_bypasses_disk_cache(monkeypatch):
+    monkeypatch.setenv("METADATA_NOCACHE", "1")
+    session = MagicMock()
+    mock_response = MagicMock(ok=True)
+    mock_response.json.return_value = {"id": "org/dataset"}
+    session.get.return_value = mock_response
+    fetcher = DatasetFetcher(session=session)
+
+    fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+    metadata_fetchers._JSON_CACHE.clear()  # simulate a fresh process
+    metadata = fetcher.fetch_metadata("https://huggingface.co/datasets/org/dataset")
+
+    assert metadata == {"id": "org/dataset"}
+    assert session.get.call_count == 2
+
+
+# Shared session
+def test_fetchers_share_default_session():
+    from src.util.metadata_fetchers import _DEFAULT_SESSION
+
+    assert HuggingFaceFetcher().session is _DEFAULT_SESSION
+    assert GitHubFetcher().session is _DEFAULT_SESSION
+    assert DatasetFetcher().session is _DEFAULT_SESSION
+
+    retry = _DEFAULT_SESSION.get_adapter("https://api.github.com").max_retries
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+
+@pytest.mark.parametrize("fetcher_cls, url, api_url", [
+    (HuggingFaceFetcher, "https://HuggingFace.co/org/model/tree/main",
+     "https://huggingface.co/api/models/org/model"),
+    (DatasetFetcher, "https://www.huggingface.co/datasets/org/data?x=1",
+     "https://huggingface.co/api/datasets/org/data"),
+    (GitHubFetcher, "https://github.com/org/repo/",
+     "https://api.github.com/repos/org/repo"),
+])
+def test_url_forms_resolve_to_api_url(fetcher_cls, url, api_url):
+    session = MagicMock()
+    session.get.return_value = MagicMock(ok=False, status_code=404)
+
+    with patch("src.util.metadata_fetchers.hf_hub_download", side_effect=Exception):
+        fetcher_cls(session=session).fetch_metadata(url)
+
+    called_urls = [c.args[0] for c in session.get.call_args_list]
+    assert api_url in called_urls
+
+
+def test_prewarm_connections_swallows_errors():
+    with patch.object(
+        metadata_fetchers._DEFAULT_SESSION, "head",
+        side_effect=requests.ConnectionError("no route"),
+    ) as mock_head, patch("src.util.metadata_fetchers.threading.Thread") as thread:
+        thread.side_effect = lambda target, args, daemon: MagicMock(
+            start=lambda: target(*args)
+        )
+        metadata_fetchers.prewarm_connections()
+
+    assert mock_head.call_count == 2
+
+
+@pytest.mark.parametrize("fetcher_cls, url", [
+    (GitHubFetcher, "https://evilgithub.com/org/repo"),
+    (GitHubFetcher, "https://github.com.attacker.net/org/repo"),
+    (HuggingFaceFetcher, "https://huggingface.co.example.net/org/model"),
+    (HuggingFaceFetcher, "https://nothuggingface.co/org/model"),
+    (DatasetFetcher, "https://huggingface.co.example.net/datasets/org/data"),
+])
+def test_lookalike_hosts_are_rejected(fetcher_cls, url):
+    session = MagicMock()
+
+    metadata = fetcher_cls(session=session).fetch_metadata(url)
+
+    assert metadata == {}
+    session.get.assert_not_called()
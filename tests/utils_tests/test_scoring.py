@@ -0,0 +1,13 @@
+from src.util.scoring import clamp01
+
+
+def test_clamp01_keeps_in_range_values():
+    assert clamp01(0.0) == 0.0
+    assert clamp01(0.42) == 0.42
+    assert clamp01(1.0) == 1.0
+
+
+def test_clamp01_clamps_out_of_range_and_nan():
+    assert clamp01(-0.5) == 0.0
+    assert clamp01(3.0) == 1.0
+    assert clamp01(float("nan")) == 0.0